@@ -4,12 +4,14 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+from moviepy.editor import VideoFileClip  # type: ignore
 
 from videoxt.api import (
     extract,
     extract_audio,
     extract_clip,
     extract_frames,
+    extract_frames_iter,
     extract_gif,
 )
 from videoxt.exceptions import InvalidExtractionMethod
@@ -74,6 +76,68 @@ def test_generic_extract_frames_valid_default_request_success_is_true(
     assert expected_destpath.is_dir()
 
 
+def test_extract_frames_with_workers_writes_every_expected_image(
+    fixture_tmp_video_filepath,
+    fixture_tmp_video_properties: dict[str, Any],
+):
+    """Test that splitting extraction between workers writes every expected image."""
+    destdir = fixture_tmp_video_filepath.parent / "tmp.test.extract.frames.workers"
+    destdir.mkdir(exist_ok=True)
+    result = extract_frames(
+        fixture_tmp_video_filepath, destdir=destdir, capture_rate=3, n_workers=3
+    )
+    try:
+        assert result.success is True
+        expected_images = [
+            f"tmp.video_{frame_num + 1}.jpg"
+            for frame_num in range(0, fixture_tmp_video_properties["frame_count"], 3)
+        ]
+        assert sorted(p.name for p in destdir.iterdir()) == sorted(expected_images)
+    finally:
+        shutil.rmtree(destdir)
+
+
+def test_extract_frames_iter_yields_edited_frames_without_writing_images(
+    fixture_tmp_video_filepath,
+    fixture_tmp_video_properties: dict[str, Any],
+):
+    """Test that iterating over frames yields the expected frames and writes nothing."""
+    files_before = set(fixture_tmp_video_filepath.parent.iterdir())
+    frames = list(
+        extract_frames_iter(
+            fixture_tmp_video_filepath, capture_rate=3, resize=0.5, rotate=90
+        )
+    )
+    width, height = fixture_tmp_video_properties["dimensions"]
+    assert [frame_num for frame_num, _ in frames] == list(
+        range(0, fixture_tmp_video_properties["frame_count"], 3)
+    )
+    assert all(frame.shape == (width // 2, height // 2, 3) for _, frame in frames)
+    assert set(fixture_tmp_video_filepath.parent.iterdir()) == files_before
+
+
+def test_extract_gif_with_bounce_doubles_the_gif_duration(fixture_tmp_video_filepath):
+    """Test that a bounced gif plays the extracted frames forward and then backward."""
+    destdir = fixture_tmp_video_filepath.parent / "tmp.test.extract.gif.bounce"
+    destdir.mkdir(exist_ok=True)
+    try:
+        forward = extract_gif(fixture_tmp_video_filepath, destdir=destdir)
+        bounced = extract_gif(
+            fixture_tmp_video_filepath,
+            destdir=destdir,
+            filename="bounced",
+            bounce=True,
+            reverse=True,
+        )
+        assert forward.success is True and bounced.success is True
+        with VideoFileClip(str(forward.destpath)) as f, VideoFileClip(
+            str(bounced.destpath)
+        ) as b:
+            assert b.duration == pytest.approx(2 * f.duration, abs=2 / f.fps)
+    finally:
+        shutil.rmtree(destdir)
+
+
 @pytest.fixture(scope="session")
 def extract_audio_result(fixture_tmp_video_filepath) -> Generator[Result, None, None]:
     """Extract audio from a video and yield a Result object."""
@@ -176,6 +240,20 @@ def test_extract_clip_valid_default_request_success_is_true(
     assert expected_destpath.is_file()
 
 
+def test_extract_clip_default_request_keeps_duration_and_audio(
+    extract_clip_result: Generator[Result, None, None],
+    fixture_tmp_video_properties: dict[str, Any],
+):
+    """Test that an unedited clip keeps the video's duration, size and audible audio."""
+    with VideoFileClip(str(extract_clip_result.destpath)) as clip:
+        assert clip.duration == pytest.approx(
+            fixture_tmp_video_properties["duration_seconds"], abs=0.1
+        )
+        assert tuple(clip.size) == fixture_tmp_video_properties["dimensions"]
+        assert clip.audio is not None
+        assert clip.audio.max_volume() > 0
+
+
 def test_generic_extract_clip_valid_default_request_success_is_true(
     generic_extract_clip_result: Generator[Result, None, None],
     fixture_tmp_video_properties: dict[str, Any],
@@ -3,7 +3,7 @@ import shutil
 
 import pytest
 
-from videoxt.cli import execute_extraction, main, split_cli_args
+from videoxt.cli import build_parser, execute_extraction, main, split_cli_args
 
 
 def test_split_cli_args():
@@ -112,6 +112,15 @@ def test_main_with_invalid_positional_arg_raises_argparse_argument_error_and_ret
         assert exit_code == 0
 
 
+def test_main_abbreviated_version_flag_prints_version_to_stdout(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--vers"])
+    assert excinfo.value.code == 0
+    captured = capsys.readouterr()
+    assert captured.out.startswith("videoxt ")
+    assert captured.err == ""
+
+
 @pytest.mark.parametrize("method", ["audio", "clip", "frames", "gif"])
 def test_main_with_invalid_video_file_returns_exit_code_1(
     fixture_tmp_video_filepath_zero_seconds, method
@@ -150,3 +159,56 @@ def test_main_videoxt_error_returns_exit_code_1(fixture_tmp_video_filepath, meth
         ]
     )
     assert exit_code == 1
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_main_version_prints_version_and_returns_exit_code_0(capsys, flag):
+    exit_code = main([flag])
+    assert exit_code == 0
+    assert capsys.readouterr().out.startswith("videoxt ")
+
+
+@pytest.mark.parametrize("method", ["audio", "clip", "frames", "gif"])
+def test_build_parser_with_subcommand_only_registers_that_subparser(method):
+    parser = build_parser(method)
+    subparsers = parser._subparsers._group_actions[0]
+    assert list(subparsers.choices) == [method]
+
+
+def test_build_parser_reuses_the_parser_built_for_a_subcommand():
+    assert build_parser("frames") is build_parser("frames")
+    assert build_parser("unknown") is build_parser(None)
+
+
+@pytest.mark.parametrize(
+    "method, option, value, dest, expected",
+    [
+        ("audio", "--audio-format", "WAV", "audio_format", "wav"),
+        ("frames", "--image-format", "Png", "image_format", "png"),
+        ("clip", "--hwaccel", "CUDA", "hwaccel", "cuda"),
+        ("gif", "--rotate", "90", "rotate", 90),
+    ],
+)
+def test_build_parser_choices_are_converted_before_checking(
+    fixture_tmp_video_filepath, method, option, value, dest, expected
+):
+    args = build_parser(method).parse_args(
+        [method, str(fixture_tmp_video_filepath), option, value]
+    )
+    assert getattr(args, dest) == expected
+
+
+@pytest.mark.parametrize(
+    "method, option, value",
+    [
+        ("audio", "--audio-format", "flac"),
+        ("frames", "--image-format", "gif"),
+        ("clip", "--hwaccel", "opencl"),
+        ("gif", "--rotate", "45"),
+    ],
+)
+def test_main_with_invalid_choice_raises_system_exit(
+    fixture_tmp_video_filepath, method, option, value
+):
+    with pytest.raises(SystemExit):
+        main([method, str(fixture_tmp_video_filepath), option, value])
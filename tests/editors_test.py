@@ -0,0 +1,168 @@
+import shutil
+from typing import Any
+
+import cv2  # type: ignore
+import numpy as np
+import pytest
+from moviepy.editor import (  # type: ignore
+    AudioFileClip,
+    ImageSequenceClip,
+    VideoClip,
+    VideoFileClip,
+    vfx,
+)
+
+import videoxt.constants as C
+import videoxt.editors as E
+from videoxt.api import extract_clip, extract_gif
+
+
+@pytest.fixture
+def fixture_numbered_clip() -> VideoClip:
+    """A 1 second, 10 fps clip whose frames are filled with their frame number."""
+    return VideoClip(
+        lambda t: np.full((8, 8, 3), round(t * 10), dtype=np.uint8), duration=1
+    ).set_fps(10)
+
+
+def test_estimate_frames_bytes(fixture_numbered_clip):
+    assert E.estimate_frames_bytes(fixture_numbered_clip) == 10 * 8 * 8 * 3
+
+
+def test_edit_clip_motion_within_budget_resequences_frames(fixture_numbered_clip):
+    clip = E.edit_clip_motion(fixture_numbered_clip, 1.0, True, True)
+    assert isinstance(clip, ImageSequenceClip)
+    assert clip.duration == pytest.approx(2)
+    frames = [int(frame[0, 0, 0]) for frame in clip.iter_frames()]
+    assert frames[:20] == [*range(9, -1, -1), *range(10)]
+
+
+def test_edit_clip_motion_over_budget_reads_the_clip_backwards(
+    fixture_numbered_clip, monkeypatch
+):
+    monkeypatch.setattr(C, "RESEQUENCE_MAX_BYTES", 0)
+    monkeypatch.setattr(E, "resequence_clip", pytest.fail)
+    clip = E.edit_clip_motion(fixture_numbered_clip, 1.0, True, True)
+    assert not isinstance(clip, ImageSequenceClip)
+    assert clip.duration == pytest.approx(2)
+    assert int(clip.get_frame(0)[0, 0, 0]) == 10
+
+
+@pytest.mark.parametrize("extract_function", [extract_clip, extract_gif])
+def test_extract_over_budget_falls_back_to_reading_backwards(
+    fixture_tmp_video_filepath, monkeypatch, extract_function
+):
+    monkeypatch.setattr(C, "RESEQUENCE_MAX_BYTES", 0)
+    monkeypatch.setattr(E, "resequence_clip", pytest.fail)
+    destdir = fixture_tmp_video_filepath.parent / "tmp.test.extract.over.budget"
+    destdir.mkdir(exist_ok=True)
+    try:
+        result = extract_function(
+            fixture_tmp_video_filepath,
+            destdir=destdir,
+            stop_time=0.5,
+            resize=0.1,
+            reverse=True,
+        )
+        assert result.success is True
+    finally:
+        shutil.rmtree(destdir)
+
+
+@pytest.fixture
+def fixture_image() -> np.ndarray:
+    """A random 40x60 (height x width) BGR image."""
+    return np.random.default_rng(0).integers(0, 256, (40, 60, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize(
+    "rotate, expected",
+    [
+        (90, lambda image: np.rot90(image, k=-1)),
+        (180, lambda image: np.rot90(image, k=2)),
+        (270, lambda image: np.rot90(image, k=1)),
+    ],
+)
+def test_edit_image_rotates_by_quarter_turns(fixture_image, rotate, expected):
+    assert np.array_equal(
+        E.edit_image(fixture_image, rotate=rotate), expected(fixture_image)
+    )
+
+
+@pytest.mark.parametrize("rotate", [0, 45, 135, 300, 360, 450, -90])
+def test_edit_image_ignores_rotations_that_are_not_quarter_turns(fixture_image, rotate):
+    assert E.edit_image(fixture_image, rotate=rotate) is fixture_image
+
+
+def test_edit_image_with_matching_dimensions_is_not_resized(fixture_image):
+    assert E.edit_image(fixture_image, dimensions=(60, 40)) is fixture_image
+
+
+@pytest.mark.parametrize("dimensions", [(30, 20), (120, 80), (90, 25)])
+def test_edit_image_resizes_to_the_requested_dimensions(fixture_image, dimensions):
+    width, height = dimensions
+    assert E.edit_image(fixture_image, dimensions=dimensions).shape == (
+        height,
+        width,
+        3,
+    )
+
+
+@pytest.mark.parametrize(
+    "dimensions, interpolation",
+    [((30, 20), cv2.INTER_AREA), ((120, 80), cv2.INTER_LINEAR)],
+)
+def test_edit_image_downscales_with_area_interpolation(
+    fixture_image, monkeypatch, dimensions, interpolation
+):
+    resize = cv2.resize
+    interpolations: list[int] = []
+
+    def recording_resize(*args: Any, interpolation: int, **kwargs: Any) -> Any:
+        interpolations.append(interpolation)
+        return resize(*args, interpolation=interpolation, **kwargs)
+
+    monkeypatch.setattr(cv2, "resize", recording_resize)
+    E.edit_image(fixture_image, dimensions=dimensions)
+    assert interpolations == [interpolation]
+
+
+@pytest.mark.parametrize(
+    "view",
+    [
+        lambda image: image,
+        lambda image: np.rot90(image),
+        lambda image: image[::2, 5:50],
+        lambda image: image[:, ::-1],
+    ],
+)
+def test_monochrome_frame_matches_blackwhite_within_one(fixture_image, view):
+    frame = view(fixture_image)
+    baseline = vfx.blackwhite(VideoClip(lambda t: frame, duration=1)).get_frame(0)
+    monochrome = E.monochrome_frame(frame)
+    assert monochrome.shape == frame.shape
+    assert monochrome.dtype == np.uint8
+    assert np.abs(monochrome.astype(int) - frame.mean(axis=2, keepdims=True)).max() <= 1
+    assert np.abs(monochrome.astype(int) - baseline.astype(int)).max() <= 1
+
+
+def test_trim_clip_from_a_start_second_reads_the_frame_at_that_second(
+    fixture_tmp_video_filepath,
+):
+    with VideoFileClip(str(fixture_tmp_video_filepath)) as untrimmed:
+        expected_frame = untrimmed.get_frame(1.0)
+        assert not np.array_equal(expected_frame, untrimmed.get_frame(0))
+
+    with VideoFileClip(str(fixture_tmp_video_filepath)) as clip:
+        trimmed = E.trim_clip(clip, 1.0, 1.5)
+        assert trimmed.duration == pytest.approx(0.5)
+        assert np.array_equal(trimmed.get_frame(0), expected_frame)
+
+
+def test_trim_clip_trims_audio_clips_like_subclip(fixture_tmp_video_filepath):
+    with AudioFileClip(str(fixture_tmp_video_filepath)) as untrimmed:
+        expected_sound = untrimmed.subclip(1.0, 1.5).to_soundarray()
+
+    with AudioFileClip(str(fixture_tmp_video_filepath)) as clip:
+        trimmed = E.trim_clip(clip, 1.0, 1.5)
+        assert np.array_equal(trimmed.to_soundarray(), expected_sound)
@@ -0,0 +1,173 @@
+import shutil
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from moviepy.editor import VideoClip, VideoFileClip  # type: ignore
+
+import videoxt.extractors as X
+from videoxt.constants import ExtractionMethod
+from videoxt.extractors import ClipExtractor, FramesExtractor
+from videoxt.handlers import ObjectFactory
+from videoxt.video import open_video_capture
+
+
+def make_clip_extractor(filepath: Path, **options: Any) -> ClipExtractor:
+    """Return a `ClipExtractor` for the video and clip request options."""
+    factory = ObjectFactory(ExtractionMethod.CLIP)
+    video = factory.make_video(filepath)
+    return ClipExtractor(factory.make_prepared_request(video, options))
+
+
+@pytest.fixture
+def fixture_clip_destdir(
+    fixture_tmp_video_filepath,
+) -> Generator[Path, None, None]:
+    """Create a directory for extracted clips and delete it afterwards."""
+    destdir = fixture_tmp_video_filepath.parent / "tmp.test.extractors.clip"
+    destdir.mkdir(exist_ok=True)
+    yield destdir
+    shutil.rmtree(destdir)
+
+
+def test_clip_extractor_default_request_is_stream_copyable(fixture_tmp_video_filepath):
+    assert make_clip_extractor(fixture_tmp_video_filepath)._is_stream_copyable()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"start_time": 1},
+        {"resize": 0.5},
+        {"dimensions": (320, 240)},
+        {"rotate": 90},
+        {"monochrome": True},
+        {"speed": 2.0},
+        {"reverse": True},
+        {"bounce": True},
+        {"volume": 0.5},
+        {"normalize": True},
+        {"hwaccel": "cuda"},
+    ],
+)
+def test_clip_extractor_with_edits_is_not_stream_copyable(
+    fixture_tmp_video_filepath, options
+):
+    extractor = make_clip_extractor(fixture_tmp_video_filepath, **options)
+    assert not extractor._is_stream_copyable()
+
+
+@pytest.mark.parametrize("suffix", [".mkv", ".avi"])
+def test_clip_extractor_from_unsupported_container_is_not_stream_copyable(
+    fixture_tmp_video_filepath, fixture_clip_destdir, suffix
+):
+    videopath = fixture_clip_destdir / f"tmp.video{suffix}"
+    shutil.copy(fixture_tmp_video_filepath, videopath)
+    assert not make_clip_extractor(videopath)._is_stream_copyable()
+
+
+def test_clip_extractor_with_start_time_cuts_exactly_without_copying(
+    fixture_tmp_video_filepath, fixture_clip_destdir, monkeypatch
+):
+    monkeypatch.setattr(X, "subprocess_call", pytest.fail)
+    extractor = make_clip_extractor(
+        fixture_tmp_video_filepath,
+        start_time=1,
+        stop_time=2,
+        destdir=fixture_clip_destdir,
+    )
+    with VideoFileClip(str(extractor.extract())) as clip:
+        assert clip.duration == pytest.approx(1, abs=0.1)
+
+
+def test_clip_extractor_falls_back_to_re_encoding_if_stream_copy_fails(
+    fixture_tmp_video_filepath, fixture_clip_destdir, monkeypatch
+):
+    def failing_subprocess_call(*args: Any, **kwargs: Any) -> None:
+        raise OSError("ffmpeg failed")
+
+    monkeypatch.setattr(X, "subprocess_call", failing_subprocess_call)
+    extractor = make_clip_extractor(
+        fixture_tmp_video_filepath, destdir=fixture_clip_destdir
+    )
+    assert extractor._is_stream_copyable()
+    with VideoFileClip(str(extractor.extract())) as clip:
+        assert clip.duration == pytest.approx(2, abs=0.1)
+        assert clip.audio is not None
+
+
+@pytest.fixture
+def fixture_write_videofile_calls(monkeypatch) -> list[dict[str, Any]]:
+    """Record the keyword arguments clips are written with, without writing them."""
+    calls: list[dict[str, Any]] = []
+
+    def write_videofile(clip: VideoClip, filename: str, **kwargs: Any) -> None:
+        calls.append(kwargs)
+
+    monkeypatch.setattr(VideoClip, "write_videofile", write_videofile)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "hwaccel, codec, ffmpeg_params",
+    [
+        (None, "libx264", None),
+        ("cuda", "h264_nvenc", None),
+        ("qsv", "h264_qsv", None),
+        ("videotoolbox", "h264_videotoolbox", None),
+        (
+            "vaapi",
+            "h264_vaapi",
+            ["-vaapi_device", "/dev/dri/renderD128", "-vf", "format=nv12,hwupload"],
+        ),
+    ],
+)
+def test_clip_extractor_encodes_with_the_requested_hwaccel(
+    fixture_tmp_video_filepath,
+    fixture_write_videofile_calls,
+    monkeypatch,
+    hwaccel,
+    codec,
+    ffmpeg_params,
+):
+    monkeypatch.delenv("VIDEOXT_VAAPI_DEVICE", raising=False)
+    extractor = make_clip_extractor(
+        fixture_tmp_video_filepath, hwaccel=hwaccel, resize=0.5
+    )
+    extractor.extract()
+    assert len(fixture_write_videofile_calls) == 1
+    assert fixture_write_videofile_calls[0]["codec"] == codec
+    assert fixture_write_videofile_calls[0]["ffmpeg_params"] == ffmpeg_params
+
+
+def test_clip_extractor_vaapi_device_can_be_set_from_the_environment(
+    fixture_tmp_video_filepath, fixture_write_videofile_calls, monkeypatch
+):
+    monkeypatch.setenv("VIDEOXT_VAAPI_DEVICE", "/dev/dri/renderD129")
+    make_clip_extractor(fixture_tmp_video_filepath, hwaccel="vaapi").extract()
+    ffmpeg_params = fixture_write_videofile_calls[0]["ffmpeg_params"]
+    assert ffmpeg_params[:2] == ["-vaapi_device", "/dev/dri/renderD129"]
+
+
+@pytest.mark.parametrize("options, buffers_used", [({}, 3), ({"monochrome": True}, 1)])
+def test_frames_extractor_only_rotates_buffers_for_unedited_frames(
+    fixture_tmp_video_filepath, monkeypatch, options, buffers_used
+):
+    factory = ObjectFactory(ExtractionMethod.FRAMES)
+    video = factory.make_video(fixture_tmp_video_filepath)
+    extractor = FramesExtractor(factory.make_prepared_request(video, options))
+    read_video_frame = FramesExtractor._read_video_frame
+    buffers: list[int] = []
+
+    def recording_read_video_frame(*args: Any, out: Any = None, **kwargs: Any) -> Any:
+        buffers.append(id(out))
+        return read_video_frame(*args, out=out, **kwargs)
+
+    monkeypatch.setattr(
+        FramesExtractor, "_read_video_frame", recording_read_video_frame
+    )
+    with open_video_capture(fixture_tmp_video_filepath) as opencap:
+        frames = list(extractor._edit_frames(opencap, list(range(6)), n_buffers=3))
+    assert len(frames) == 6
+    assert len(set(buffers)) == buffers_used
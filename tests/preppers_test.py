@@ -0,0 +1,90 @@
+from typing import Any
+
+import pytest
+
+from videoxt.exceptions import PreparationError, ValidationError
+from videoxt.preppers import ExtractionRange, prepare_extraction_range
+
+DURATION_SECONDS = 20.0
+FRAME_COUNT = 600
+FPS = 30.0
+
+
+def compute_range(start_time: Any, stop_time: Any) -> dict[str, Any]:
+    """Return the extraction range of a 20 second, 30 fps video."""
+    return ExtractionRange.compute(
+        DURATION_SECONDS, FRAME_COUNT, start_time, stop_time, FPS
+    )
+
+
+@pytest.mark.parametrize(
+    "start_time, stop_time",
+    [(5, 10), (5.0, 10.0), ("0:05", "0:10"), ("0:00:05", "0:00:10")],
+)
+def test_extraction_range_from_seconds_and_timestamps(start_time, stop_time):
+    """Test that seconds and timestamps are converted to every representation."""
+    assert compute_range(start_time, stop_time) == {
+        "start_second": 5.0,
+        "stop_second": 10.0,
+        "start_timestamp": "0:00:05",
+        "stop_timestamp": "0:00:10",
+        "start_frame": 150,
+        "stop_frame": 300,
+    }
+
+
+def test_extraction_range_stop_after_duration_is_clamped_to_duration():
+    """Test that a stop time past the end of the video stops at its end."""
+    extraction_range = compute_range(5, 30)
+    assert extraction_range["stop_second"] == DURATION_SECONDS
+    assert extraction_range["stop_timestamp"] == "0:00:20"
+    assert extraction_range["stop_frame"] == FRAME_COUNT
+
+
+def test_extraction_range_negative_start_is_clamped_to_zero():
+    """Test that a negative start time starts at the beginning of the video."""
+    extraction_range = compute_range(-5, 10)
+    assert extraction_range["start_second"] == 0
+    assert extraction_range["start_timestamp"] == "0:00:00"
+    assert extraction_range["start_frame"] == 0
+
+
+def test_extraction_range_frame_numbers_are_truncated():
+    """Test that frame numbers of times between frames round down."""
+    extraction_range = compute_range(1.25, 2.5)
+    assert extraction_range["start_frame"] == 37
+    assert extraction_range["stop_frame"] == 75
+
+
+@pytest.mark.parametrize("start_time, stop_time", [(20, 30), (10, 10), (10, 5)])
+def test_extraction_range_invalid_range_raises(start_time, stop_time):
+    """Test that a range starting at the end or stopping before its start raises."""
+    with pytest.raises(ValidationError):
+        compute_range(start_time, stop_time)
+
+
+@pytest.mark.parametrize(
+    "start_time, stop_time",
+    [(5, 10), ("0:00:05", "0:00:10"), (-5, 30), (1.25, 2.5)],
+)
+def test_extraction_range_compute_matches_to_dict(start_time, stop_time):
+    """Test that `compute` returns what an `ExtractionRange` would."""
+    extraction_range = ExtractionRange(
+        duration_seconds=DURATION_SECONDS,
+        frame_count=FRAME_COUNT,
+        start_time=start_time,
+        stop_time=stop_time,
+        fps=FPS,
+    )
+    assert compute_range(start_time, stop_time) == extraction_range.to_dict()
+
+
+@pytest.mark.parametrize(
+    "start_time, stop_time, fps", [(None, 10, FPS), (5, None, FPS), (5, 10, None)]
+)
+def test_prepare_extraction_range_missing_values_raises(start_time, stop_time, fps):
+    """Test that preparing a range without a start, stop or fps raises."""
+    with pytest.raises(PreparationError):
+        prepare_extraction_range(
+            DURATION_SECONDS, FRAME_COUNT, start_time, stop_time, fps
+        )
@@ -1,7 +1,9 @@
 import json
+import os
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -17,6 +19,7 @@ from videoxt.utils import (
     enumerate_filepath,
     parse_kwargs,
     seconds_to_timestamp,
+    sibling_name_checker,
     timedelta_to_timestamp,
     timestamp_to_seconds,
 )
@@ -173,6 +176,57 @@ def test_enumerate_filepath_new_file(fixture_tmp_text_filepath: Path):
     assert enumerate_filepath(expected_path) == expected_path
 
 
+def test_enumerate_filepath_skips_every_taken_enumeration(tmp_path: Path):
+    """Test that the first free enumeration is used past the names checked by stat."""
+    taken = ["clip.mp4", "clip_vxt.mp4"]
+    taken += [f"clip_vxt ({index}).mp4" for index in [*range(2, 12), 13]]
+    for name in taken:
+        (tmp_path / name).touch()
+    expected_path = tmp_path / "clip_vxt (12).mp4"
+    assert enumerate_filepath(tmp_path / "clip.mp4", tag="_vxt") == expected_path
+
+
+@pytest.mark.parametrize("max_stats", [0, 8])
+def test_sibling_name_checker_agrees_with_exists_before_and_after_listing(
+    tmp_path: Path, max_stats: int
+):
+    """Test that names checked by stat and against the listing get the same answer."""
+    (tmp_path / "CLIP_VXT.mp4").touch()
+    is_taken = sibling_name_checker(tmp_path / "clip.mp4", max_stats=max_stats)
+    for name in ["CLIP_VXT.mp4", "clip_vxt.mp4", "clip_vxt (2).mp4"]:
+        assert is_taken(name) is (tmp_path / name).exists()
+
+
+def test_sibling_name_checker_confirms_names_missing_from_the_listing(
+    tmp_path: Path, monkeypatch
+):
+    """Test that a name missing from the listing is taken if it exists in other case."""
+
+    def exists_ignoring_case(path: Path) -> bool:
+        return path.name.casefold() in {p.name.casefold() for p in tmp_path.iterdir()}
+
+    (tmp_path / "CLIP_VXT.mp4").touch()
+    monkeypatch.setattr(Path, "exists", exists_ignoring_case)
+    is_taken = sibling_name_checker(tmp_path / "clip.mp4", max_stats=0)
+    assert is_taken("clip_vxt.mp4") is True
+    assert is_taken("clip_vxt (2).mp4") is False
+
+
+def test_sibling_name_checker_falls_back_to_exists_if_listing_fails(
+    tmp_path: Path, monkeypatch
+):
+    """Test that every name is checked with stat if the directory can't be listed."""
+
+    def failing_scandir(path: Any) -> None:
+        raise PermissionError(path)
+
+    (tmp_path / "clip_vxt.mp4").touch()
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+    is_taken = sibling_name_checker(tmp_path / "clip.mp4", max_stats=0)
+    assert is_taken("clip_vxt.mp4") is True
+    assert is_taken("clip_vxt (2).mp4") is False
+
+
 @dataclass
 class Image:
     """Test dataclass for the `utils.parse_kwargs` function."""
@@ -15,6 +15,7 @@ from videoxt.validators import (
     valid_extraction_range,
     valid_filename,
     valid_filepath,
+    valid_hwaccel,
     valid_image_format,
     valid_rotate_value,
     valid_start_time,
@@ -588,6 +589,21 @@ def test_valid_audio_format_invalid_empty_string():
         valid_audio_format("")
 
 
+def test_valid_hwaccel_valid_hwaccels():
+    for hwaccel in C.SUPPORTED_HWACCELS:
+        assert valid_hwaccel(hwaccel) == hwaccel
+
+
+def test_valid_hwaccel_valid_hwaccels_uppercase():
+    for hwaccel in C.SUPPORTED_HWACCELS:
+        assert valid_hwaccel(hwaccel.upper()) == hwaccel
+
+
+def test_valid_hwaccel_invalid_hwaccel():
+    with pytest.raises(ValidationError):
+        valid_hwaccel("invalid")
+
+
 @pytest.mark.parametrize(
     ("dimensions", "expected"),
     [
@@ -1,8 +1,21 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
 import cv2  # type: ignore
+import numpy as np
 import pytest
+from moviepy.editor import VideoClip  # type: ignore
 
 from videoxt.exceptions import ClosedVideoCaptureError, VideoValidationError
-from videoxt.video import Video, fetch_video_properties, open_video_capture
+from videoxt.video import (
+    Video,
+    VideoProperties,
+    fetch_video_properties,
+    get_video_properties,
+    open_video_capture,
+)
 
 
 def test_open_video_capture_if_filepath_as_path_and_is_valid_video_file(
@@ -76,6 +89,39 @@ def test_fetch_video_properties_if_filepath_is_valid_video_file(
     )
 
 
+def test_get_video_properties_if_filepath_is_valid_video_file(
+    fixture_tmp_video_filepath, fixture_tmp_video_properties
+):
+    properties = get_video_properties(fixture_tmp_video_filepath)
+    assert properties == VideoProperties(
+        fixture_tmp_video_properties["dimensions"],
+        fixture_tmp_video_properties["fps"],
+        fixture_tmp_video_properties["frame_count"],
+    )
+    assert all(isinstance(dim, int) for dim in properties.dimensions)
+    assert isinstance(properties.fps, float)
+    assert isinstance(properties.frame_count, int)
+
+
+def test_fetch_video_properties_is_cached_until_the_file_changes(
+    fixture_tmp_video_filepath, fixture_tmp_dir, monkeypatch
+):
+    videopath = fixture_tmp_dir / "tmp.video.cached.mp4"
+    shutil.copy(fixture_tmp_video_filepath, videopath)
+    try:
+        fetched_properties = fetch_video_properties(videopath)
+        fetched_properties["fps"] = None
+        monkeypatch.setattr("videoxt.video.open_video_capture", None)
+        assert fetch_video_properties(videopath)["fps"] is not None
+
+        monkeypatch.undo()
+        videopath.write_bytes(b"not a video anymore")
+        with pytest.raises(ClosedVideoCaptureError):
+            fetch_video_properties(videopath)
+    finally:
+        videopath.unlink()
+
+
 def test_video_object_is_instance_of_video_dataclass(fixture_tmp_video_filepath):
     video = Video(fixture_tmp_video_filepath)
     assert isinstance(video, Video)
@@ -101,6 +147,13 @@ def test_video_object_attributes_match_expected_values(
     )
 
 
+def test_video_object_has_audio_is_false_for_a_video_without_audio(tmp_path):
+    videopath = tmp_path / "tmp.video.no.audio.mp4"
+    clip = VideoClip(lambda t: np.zeros((48, 64, 3), dtype=np.uint8), duration=1)
+    clip.write_videofile(str(videopath), fps=10, audio=False, logger=None)
+    assert Video(videopath).has_audio is False
+
+
 def test_video_object_with_invalid_filepath_raises_cv2_error(
     fixture_tmp_video_filepath_zero_seconds,
 ):
@@ -167,3 +220,35 @@ def test_fetch_video_properties_with_invalid_filepath_raises_cv2_error(
 ):
     with pytest.raises(ClosedVideoCaptureError):
         fetch_video_properties(fixture_tmp_video_filepath_zero_seconds)
+
+
+def test_get_video_properties_is_cached_per_resolved_path(
+    fixture_tmp_video_filepath, tmp_path, monkeypatch
+):
+    for dirname in ["a", "b"]:
+        (tmp_path / dirname).mkdir()
+        shutil.copy(fixture_tmp_video_filepath, tmp_path / dirname / "video.mp4")
+
+    # Give both copies the same modification time and size, so only the path differs.
+    stat_result = (tmp_path / "a" / "video.mp4").stat()
+    os.utime(
+        tmp_path / "b" / "video.mp4",
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns),
+    )
+
+    read_filepaths: list[str] = []
+
+    def recording_open_video_capture(filepath: Any) -> Any:
+        read_filepaths.append(str(filepath))
+        return open_video_capture(filepath)
+
+    monkeypatch.setattr(
+        "videoxt.video.open_video_capture", recording_open_video_capture
+    )
+    for dirname in ["a", "b"]:
+        monkeypatch.chdir(tmp_path / dirname)
+        get_video_properties(Path("video.mp4"))
+
+    assert read_filepaths == [
+        str((tmp_path / dirname / "video.mp4").resolve()) for dirname in ["a", "b"]
+    ]
@@ -10,6 +10,7 @@ Contents:
 - `extract_audio`: Extract audio from a video file.
 - `extract_clip`: Extract a short clip from a video file as `mp4`.
 - `extract_frames`: Extract individual frames from a video and save them as images.
+- `extract_frames_iter`: Iterate over individual frames of a video without saving them.
 - `extract_gif`: Create a GIF from a video between two specified points.
 
 Basic Usage:
@@ -43,11 +44,35 @@ Basic Usage:
 """
 
 # flake8: noqa
+from typing import TYPE_CHECKING, Any
 
-from videoxt.api import (
-    extract,
-    extract_audio,
-    extract_clip,
-    extract_frames,
-    extract_gif,
-)
+if TYPE_CHECKING:
+    from videoxt.api import (
+        extract,
+        extract_audio,
+        extract_clip,
+        extract_frames,
+        extract_frames_iter,
+        extract_gif,
+    )
+
+__all__ = [
+    "extract",
+    "extract_audio",
+    "extract_clip",
+    "extract_frames",
+    "extract_frames_iter",
+    "extract_gif",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import `videoxt.api` on first access to one of its functions, so that importing a
+    submodule such as `videoxt.cli` doesn't load OpenCV and moviepy up front (PEP 562).
+    """
+    if name in __all__:
+        import videoxt.api
+
+        return getattr(videoxt.api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,24 @@
 """Simple interface for extracting audio, clips, frames, and gifs from a video file."""
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+import numpy as np
 
 from videoxt.constants import ExtractionMethod
 from videoxt.exceptions import InvalidExtractionMethod
+from videoxt.extractors import FramesExtractor
 from videoxt.handlers import ExtractionHandler
+from videoxt.requestors import PreparedFramesRequest
 from videoxt.result import Result
 
+# Lookup of extraction methods by name and the handler reused for each of them. Handlers
+# hold no per-extraction state, so a single instance per method can serve every call.
+_METHOD_MAP: dict[str, ExtractionMethod] = {em.value: em for em in ExtractionMethod}
+_HANDLERS: dict[ExtractionMethod, ExtractionHandler] = {
+    em: ExtractionHandler(em) for em in ExtractionMethod
+}
+
 
 def extract(
     method: str,
@@ -46,18 +58,17 @@ def extract(
         `InvalidExtractionMethod`:
             If the extraction method is neither "audio", "clip", "frames", nor "gif".
     """
-    try:
-        method_enum = ExtractionMethod[method.upper()]
+    method_enum = _METHOD_MAP.get(method.lower())
 
-    except KeyError:
+    if method_enum is None:
         raise InvalidExtractionMethod(
             f"Invalid extraction method: {method}. "
-            f"Choices are {', '.join([em.value for em in ExtractionMethod])}."
+            f"Choices are {', '.join(_METHOD_MAP)}."
         )
 
-    else:
-        handler = ExtractionHandler(method_enum)
-        return handler.execute(filepath, options, skip_validation=skip_validation)
+    return _HANDLERS[method_enum].execute(
+        filepath, options, skip_validation=skip_validation
+    )
 
 
 def extract_audio(
@@ -146,8 +157,7 @@ def extract_audio(
         "normalize": normalize,
     }
 
-    handler = ExtractionHandler(ExtractionMethod.AUDIO)
-    return handler.execute(filepath, options)
+    return _HANDLERS[ExtractionMethod.AUDIO].execute(filepath, options)
 
 
 def extract_clip(
@@ -166,8 +176,9 @@ def extract_clip(
     bounce: bool = False,
     reverse: bool = False,
     monochrome: bool = False,
-    volume: float = 0,
+    volume: float = 1,
     normalize: bool = False,
+    hwaccel: str | None = None,
 ) -> Result:
     """
     Extract a clip from a video file as `mp4`.
@@ -210,6 +221,8 @@ def extract_clip(
             Resize the dimensions of the clip by a factor of `n`. A value of 0.5
             will halve the dimensions. If you specify `dimensions`, `resize` will apply
             to the dimensions you specify. Defaults to 1.0 if not specified (no change).
+            Frames are resized once, before `rotate` and `monochrome` are applied, so
+            both operate on the resized pixels.
         `rotate` (int):
             Rotate the clip by `n` degrees. Allowed values: 0, 90, 180 or 270. Defaults
             to 0 if not specified (no change).
@@ -231,6 +244,13 @@ def extract_clip(
             If True, normalize the audio. Normalization adjusts the gain of the audio to
             ensure consistent levels, preventing distortion and enhancing clarity in
             some cases. Defaults to False if not specified.
+        `hwaccel` (str | None):
+            Encode the clip with a hardware H.264 encoder. Allowed values: 'cuda',
+            'qsv', 'vaapi' or 'videotoolbox'. Defaults to None if not specified
+            (software encoding with 'libx264'). 'vaapi' encodes on the render device
+            in the `VIDEOXT_VAAPI_DEVICE` environment variable, '/dev/dri/renderD128'
+            if it isn't set.
+            See: `videoxt.constants.SUPPORTED_HWACCELS`.
 
     Returns:
     -----
@@ -253,10 +273,10 @@ def extract_clip(
         "monochrome": monochrome,
         "volume": volume,
         "normalize": normalize,
+        "hwaccel": hwaccel,
     }
 
-    handler = ExtractionHandler(ExtractionMethod.CLIP)
-    return handler.execute(filepath, options)
+    return _HANDLERS[ExtractionMethod.CLIP].execute(filepath, options)
 
 
 def extract_frames(
@@ -274,6 +294,7 @@ def extract_frames(
     resize: float = 1.0,
     rotate: int = 0,
     monochrome: bool = False,
+    n_workers: int = 1,
 ) -> Result:
     """
     Extract individual frames from a video and save them to disk as images.
@@ -322,12 +343,18 @@ def extract_frames(
             Resize the dimensions of the images by a factor of `n`. A value of 0.5
             will halve the dimensions. If you specify `dimensions`, `resize` will apply
             to the dimensions you specify. Defaults to 1.0 if not specified (no change).
+            Frames are resized once, before `rotate` and `monochrome` are applied, so
+            both operate on the resized pixels.
         `rotate` (int):
             Rotate the images by `n` degrees. Allowed values: 0, 90, 180 or 270.
             Defaults to 0 if not specified (no change).
         `monochrome` (bool):
             If True, apply a black-and-white filter to the images. Defaults to False if
             not specified.
+        `n_workers` (int):
+            Split the frames to extract between `n` threads, each decoding its own
+            contiguous range of the video. Can speed up extraction from long videos.
+            Defaults to 1 if not specified.
 
     Returns:
     -----
@@ -347,10 +374,82 @@ def extract_frames(
         "resize": resize,
         "rotate": rotate,
         "monochrome": monochrome,
+        "n_workers": n_workers,
+    }
+
+    return _HANDLERS[ExtractionMethod.FRAMES].execute(filepath, options)
+
+
+def extract_frames_iter(
+    filepath: Path | str,
+    start_time: float | int | str = 0,
+    stop_time: float | int | str | None = None,
+    fps: float | None = None,
+    capture_rate: int = 1,
+    dimensions: tuple[int, int] | None = None,
+    resize: float = 1.0,
+    rotate: int = 0,
+    monochrome: bool = False,
+) -> Iterator[tuple[int, np.ndarray[Any, Any]]]:
+    """
+    Iterate over individual frames of a video without saving them to disk.
+
+    Frames are decoded and edited one at a time as the iterator is consumed, making this
+    the preferred way to feed frames into another program (e.g. running inference on
+    each frame) instead of writing images and reading them back.
+
+    Args:
+    -----
+        `filepath` (Path | str):
+            Path to the video file with extension.
+        `start_time` (float | int | str):
+            Specify the extraction's start time in seconds, or as a string in "HH:MM:SS"
+            format. Defaults to 0 if not specified.
+        `stop_time` (float | int | str | None):
+            Specify the extraction's stop time in seconds, or as a string in "HH:MM:SS"
+            format. Defaults to the video duration if not specified.
+        `fps` (float | None):
+            Override the frames per second (fps) value obtained from `cv2` when reading
+            the video. See `extract_frames`.
+        `capture_rate` (int):
+            Capture every Nth video frame. Defaults to 1 if not specified, which
+            yields every frame within the extraction range.
+        `dimensions` (tuple[int, int] | None):
+            Specify the dimensions (frame width, frame height) of the frames. Defaults
+            to the video dimensions if not specified.
+        `resize` (float):
+            Resize the dimensions of the frames by a factor of `n`. If you specify
+            `dimensions`, `resize` will apply to the dimensions you specify. Defaults to
+            1.0 if not specified (no change).
+        `rotate` (int):
+            Rotate the frames by `n` degrees. Allowed values: 0, 90, 180 or 270.
+            Defaults to 0 if not specified (no change).
+        `monochrome` (bool):
+            If True, convert the frames to single-channel grayscale. Defaults to False
+            if not specified.
+
+    Returns:
+    -----
+        `Iterator[tuple[int, np.ndarray[Any, Any]]]`:
+            The frame number (0-based) and the BGR (or grayscale) frame of each frame
+            within the extraction range. The video file and options are validated
+            before the iterator is returned.
+    """
+    options = {
+        "start_time": start_time,
+        "stop_time": stop_time,
+        "fps": fps,
+        "capture_rate": capture_rate,
+        "dimensions": dimensions,
+        "resize": resize,
+        "rotate": rotate,
+        "monochrome": monochrome,
     }
 
-    handler = ExtractionHandler(ExtractionMethod.FRAMES)
-    return handler.execute(filepath, options)
+    factory = _HANDLERS[ExtractionMethod.FRAMES].object_factory
+    video = factory.make_video(filepath)
+    request = cast(PreparedFramesRequest, factory.make_prepared_request(video, options))
+    return FramesExtractor(request).iter_frames()
 
 
 def extract_gif(
@@ -411,6 +510,8 @@ def extract_gif(
             Resize the dimensions of the gif by a factor of `n`. A value of 0.5
             will halve the dimensions. If you specify `dimensions`, `resize` will apply
             to the dimensions you specify. Defaults to 1.0 if not specified (no change).
+            Frames are resized once, before `rotate` and `monochrome` are applied, so
+            both operate on the resized pixels.
         `rotate` (int):
             Rotate the gif by `n` degrees. Allowed values: 0, 90, 180 or 270. Defaults
             to 0 if not specified (no change).
@@ -448,5 +549,4 @@ def extract_gif(
         "monochrome": monochrome,
     }
 
-    handler = ExtractionHandler(ExtractionMethod.GIF)
-    return handler.execute(filepath, options)
+    return _HANDLERS[ExtractionMethod.GIF].execute(filepath, options)
@@ -22,21 +22,59 @@ options:
 ```
 """
 import argparse
+import sys
 from collections.abc import Sequence
-from functools import partial
+from functools import cache, partial
 from typing import Any
 
-import videoxt.api
+import videoxt.constants as C
 import videoxt.validators as V
 from videoxt.constants import (
     SUPPORTED_AUDIO_FORMATS,
+    SUPPORTED_HWACCELS,
     SUPPORTED_IMAGE_FORMATS,
     VALID_ROTATE_VALUES,
-    VERSION,
 )
 from videoxt.exceptions import VideoXTError
 
 
+def version_string(prog: str = "videoxt") -> str:
+    """Return the version line printed by `--version`, e.g. 'videoxt 1.1.3'."""
+    return f"{prog} {C.VERSION}"
+
+
+class VersionAction(argparse.Action):
+    """
+    Print the program's version and exit. Unlike argparse's built-in `version` action,
+    the version is only looked up when the flag is actually passed.
+    """
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: str = "show program's version number and exit",
+    ) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        print(version_string(parser.prog))
+        parser.exit()
+
+
 def split_cli_args(args: argparse.Namespace) -> tuple[str, str, dict[str, Any]]:
     """
     Split the arguments into a tuple containing the extraction method, filepath, and
@@ -80,6 +118,9 @@ def execute_extraction(
     -----
         `int` : 0 if the extraction was successful, 1 otherwise.
     """
+    # Imported here so that `--help`, `--version` and argument errors return without
+    # loading OpenCV and moviepy.
+    import videoxt.api
 
     try:
         videoxt.api.extract(method, filepath, skip_validation=True, **options)
@@ -90,28 +131,16 @@ def execute_extraction(
         return 0
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    """
-    The main entry point when called from the command-line. By default, `verbose` mode
-    is enabled, which prints details about the prepared extraction request and the
-    result. To disable this output, use the `--quiet` or `-q` flag.
-
-    Args:
-    -----
-        `argv` (Sequence[str] | None): The arguments from the CLI.
-
-    Returns:
-    -----
-        `int`: 0 if the extraction was successful, 1 otherwise.
-    """
-    # parent_parser houses arguments common to all subparsers
-    parent_parser = argparse.ArgumentParser(add_help=False)
-    parent_parser.add_argument(
+@cache
+def parent_parser() -> argparse.ArgumentParser:
+    """Return the parent parser housing arguments common to all subparsers."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
         "filepath",
         type=partial(V.valid_filepath, is_video=True),
         help="Path to the video file with extension.",
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--start-time",
         "-s",
         type=V.valid_start_time,
@@ -123,7 +152,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             "timestamp (Ex: --start-time 0:45 or -s 45)."
         ),
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--stop-time",
         "-S",
         type=V.valid_stop_time,
@@ -134,7 +163,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             "timestamp (Ex: --stop-time 1:30 or -S 90)."
         ),
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--destdir",
         "-d",
         type=V.valid_dir,
@@ -145,7 +174,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             "media is saved in the directory of the input video file."
         ),
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--filename",
         "-fn",
         type=V.valid_filename,
@@ -156,21 +185,21 @@ def main(argv: Sequence[str] | None = None) -> int:
             "If not provided, the video's filename is used."
         ),
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--quiet",
         "-q",
         action="store_false",
         dest="verbose",
         help="Disable extraction details from being printed to the console.",
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--overwrite",
         "-ov",
         action="store_true",
         dest="overwrite",
         help="Overwrite the output file(s) if they already exist.",
     )
-    parent_parser.add_argument(
+    parser.add_argument(
         "--fps",
         "-f",
         type=V.valid_fps,
@@ -180,10 +209,14 @@ def main(argv: Sequence[str] | None = None) -> int:
             "Helpful if the FPS is not read accurately by OpenCV. Use with caution."
         ),
     )
+    return parser
 
-    # parent_parser_audio houses arguments common to audio and clip subparsers
-    parent_parser_audio = argparse.ArgumentParser(add_help=False)
-    parent_parser_audio.add_argument(
+
+@cache
+def parent_parser_audio() -> argparse.ArgumentParser:
+    """Return the parent parser housing arguments common to audio and clip."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
         "--volume",
         "-v",
         type=V.valid_volume,
@@ -191,22 +224,26 @@ def main(argv: Sequence[str] | None = None) -> int:
         metavar="",
         help="Increase or decrease the output audio volume by a factor of N.",
     )
-    parent_parser_audio.add_argument(
+    parser.add_argument(
         "--normalize",
         action="store_true",
         help="Normalize the audio output to a maximum of 0dB.",
     )
+    return parser
+
 
-    # parent_parser_image houses arguments common to clip, frames and gif subparsers
-    parent_parser_image = argparse.ArgumentParser(add_help=False)
-    parent_parser_image.add_argument(
+@cache
+def parent_parser_image() -> argparse.ArgumentParser:
+    """Return the parent parser housing arguments common to clip, frames and gif."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
         "--dimensions",
         "-dm",
         type=V.valid_dimensions_str,
         metavar="",
         help="Resize the output to a specific width and height (Ex: -dm 1920x1080).",
     )
-    parent_parser_image.add_argument(
+    parser.add_argument(
         "--resize",
         "-rs",
         type=V.valid_resize,
@@ -214,25 +251,29 @@ def main(argv: Sequence[str] | None = None) -> int:
         metavar="",
         help="Increase or decrease the dimensions of the output by a factor of N.",
     )
-    parent_parser_image.add_argument(
+    parser.add_argument(
         "--rotate",
         "-rt",
-        type=V.valid_rotate_value,
-        choices=VALID_ROTATE_VALUES,
+        type=int,
+        choices=sorted(VALID_ROTATE_VALUES),
         default=0,
         metavar="",
         dest="rotate",
         help="Rotate the output by 90, 180, or 270 degrees.",
     )
-    parent_parser_image.add_argument(
+    parser.add_argument(
         "--monochrome",
         action="store_true",
         help="Apply a black-and-white filter to the output.",
     )
+    return parser
+
 
-    # parent_parser_motion houses arguments common to audio, clip and gif subparsers
-    parent_parser_motion = argparse.ArgumentParser(add_help=False)
-    parent_parser_motion.add_argument(
+@cache
+def parent_parser_motion() -> argparse.ArgumentParser:
+    """Return the parent parser housing arguments common to audio, clip and gif."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
         "--speed",
         "-sp",
         type=V.valid_speed,
@@ -240,72 +281,76 @@ def main(argv: Sequence[str] | None = None) -> int:
         metavar="",
         help="Increase or decrease the speed of the output by a factor of N.",
     )
-    parent_parser_motion.add_argument(
+    parser.add_argument(
         "--bounce",
         action="store_true",
         help="Make the output bounce back-and-forth, boomerang style.",
     )
-    parent_parser_motion.add_argument(
+    parser.add_argument(
         "--reverse",
         action="store_true",
         help="Reverse the output.",
     )
+    return parser
 
-    # main_parser encompasses all subparsers
-    main_parser = argparse.ArgumentParser(
-        prog="videoxt",
-        description=(
-            "Extract audio, individual frames, short clips and GIFs from videos."
-        ),
-    )
-    main_parser.add_argument(
-        "--version",
-        "-V",
-        action="version",
-        version=f"%(prog)s {VERSION}",
-    )
-    subparsers = main_parser.add_subparsers(dest="subparser_name", required=True)
 
-    # audio subparser
+def add_audio_subparser(subparsers: Any) -> None:
+    """Register the `audio` subcommand on the main parser's subparsers."""
     subparser_audio = subparsers.add_parser(
         "audio",
         help="Extract audio from a video file.",
-        parents=[parent_parser, parent_parser_audio, parent_parser_motion],
+        parents=[parent_parser(), parent_parser_audio(), parent_parser_motion()],
     )
     subparser_audio.add_argument(
         "--audio-format",
         "-af",
-        type=V.valid_audio_format,
-        choices=SUPPORTED_AUDIO_FORMATS,
+        type=str.lower,
+        choices=sorted(SUPPORTED_AUDIO_FORMATS),
         default="mp3",
         metavar="",
         dest="audio_format",
         help="Set the extracted audio file format. Default is 'mp3'.",
     )
 
-    # clip subparser
-    subparsers.add_parser(
+
+def add_clip_subparser(subparsers: Any) -> None:
+    """Register the `clip` subcommand on the main parser's subparsers."""
+    subparser_clip = subparsers.add_parser(
         "clip",
         help="Extract a short clip from a video file as 'mp4'.",
         parents=[
-            parent_parser,
-            parent_parser_audio,
-            parent_parser_image,
-            parent_parser_motion,
+            parent_parser(),
+            parent_parser_audio(),
+            parent_parser_image(),
+            parent_parser_motion(),
         ],
     )
+    subparser_clip.add_argument(
+        "--hwaccel",
+        "-hw",
+        type=str.lower,
+        choices=sorted(SUPPORTED_HWACCELS),
+        metavar="",
+        dest="hwaccel",
+        help=(
+            "Encode the clip with a hardware H.264 encoder "
+            "(cuda, qsv, vaapi or videotoolbox)."
+        ),
+    )
+
 
-    # frames subparser
+def add_frames_subparser(subparsers: Any) -> None:
+    """Register the `frames` subcommand on the main parser's subparsers."""
     subparser_frames = subparsers.add_parser(
         "frames",
         help="Extract individual frames from a video and save them as images.",
-        parents=[parent_parser, parent_parser_image],
+        parents=[parent_parser(), parent_parser_image()],
     )
     subparser_frames.add_argument(
         "--image-format",
         "-if",
-        type=V.valid_image_format,
-        choices=SUPPORTED_IMAGE_FORMATS,
+        type=str.lower,
+        choices=sorted(SUPPORTED_IMAGE_FORMATS),
         default="jpg",
         metavar="",
         dest="image_format",
@@ -320,13 +365,107 @@ def main(argv: Sequence[str] | None = None) -> int:
         dest="capture_rate",
         help="Capture every Nth video frame. Default is 1, which captures every frame.",
     )
+    subparser_frames.add_argument(
+        "--workers",
+        "-w",
+        type=V.positive_int,
+        default=1,
+        metavar="",
+        dest="n_workers",
+        help="Split extraction between N threads. Default is 1.",
+    )
+
 
-    # gif subparser
+def add_gif_subparser(subparsers: Any) -> None:
+    """Register the `gif` subcommand on the main parser's subparsers."""
     subparsers.add_parser(
         "gif",
         help="Create a GIF from a video between two specified points.",
-        parents=[parent_parser, parent_parser_image, parent_parser_motion],
+        parents=[parent_parser(), parent_parser_image(), parent_parser_motion()],
+    )
+
+
+SUBPARSER_BUILDERS = {
+    "audio": add_audio_subparser,
+    "clip": add_clip_subparser,
+    "frames": add_frames_subparser,
+    "gif": add_gif_subparser,
+}
+
+
+def build_parser(subcommand: str | None = None) -> argparse.ArgumentParser:
+    """
+    Return the main parser. If `subcommand` names a known extraction method, only that
+    subparser (and the parent parsers it uses) is constructed, otherwise all of them
+    are, as needed to print the top-level help or reject an unknown subcommand.
+
+    Parsers are built once per process and reused by later calls.
+
+    Args:
+    -----
+        `subcommand` (str | None):
+            The extraction method given on the command-line, if any.
+
+    Returns:
+    -----
+        `argparse.ArgumentParser`: The main parser.
+    """
+    if subcommand not in SUBPARSER_BUILDERS:
+        subcommand = None
+
+    return _build_parser(subcommand)
+
+
+@cache
+def _build_parser(subcommand: str | None) -> argparse.ArgumentParser:
+    """Build the main parser returned by `build_parser`."""
+    main_parser = argparse.ArgumentParser(
+        prog="videoxt",
+        description=(
+            "Extract audio, individual frames, short clips and GIFs from videos."
+        ),
+    )
+    main_parser.add_argument(
+        "--version",
+        "-V",
+        action=VersionAction,
     )
+    subparsers = main_parser.add_subparsers(dest="subparser_name", required=True)
+
+    if subcommand is not None:
+        SUBPARSER_BUILDERS[subcommand](subparsers)
+    else:
+        for add_subparser in SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
+
+    return main_parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    The main entry point when called from the command-line. By default, `verbose` mode
+    is enabled, which prints details about the prepared extraction request and the
+    result. To disable this output, use the `--quiet` or `-q` flag.
+
+    Args:
+    -----
+        `argv` (Sequence[str] | None): The arguments from the CLI.
+
+    Returns:
+    -----
+        `int`: 0 if the extraction was successful, 1 otherwise.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    subcommand = argv[0] if argv else None
+
+    # `--version` needs no parser at all.
+    if subcommand in ("--version", "-V"):
+        print(version_string())
+        return 0
+
+    main_parser = build_parser(subcommand)
 
     # Parse the arguments and execute the extraction.
     try:
@@ -1,10 +1,25 @@
 """Contains constants used throughout the libary and version information."""
-import importlib.metadata
+import functools
 from enum import Enum
 
-import cv2  # type: ignore
+# Resolved on first access by `__getattr__`, keeping the package metadata lookup out of
+# the import of this module.
+VERSION: str
 
-VERSION = importlib.metadata.version("videoxt")
+
+@functools.cache
+def _version() -> str:
+    """Return the installed version of the `videoxt` distribution."""
+    import importlib.metadata
+
+    return importlib.metadata.version("videoxt")
+
+
+def __getattr__(name: str) -> str:
+    """Lazily resolve `VERSION` (PEP 562)."""
+    if name == "VERSION":
+        return _version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ExtractionMethod(Enum):
@@ -29,49 +44,96 @@ class ExtractionMethod(Enum):
     GIF = "gif"
 
 
-SUPPORTED_VIDEO_FORMATS = {
-    "3gp",
-    "asf",
-    "avi",
-    "divx",
-    "flv",
-    "m4v",
-    "mkv",
-    "mov",
-    "mp4",
-    "mpeg",
-    "mpg",
-    "ogv",
-    "rm",
-    "ts",
-    "vob",
-    "webm",
-    "wmv",
-}
+SUPPORTED_VIDEO_FORMATS = frozenset(
+    {
+        "3gp",
+        "asf",
+        "avi",
+        "divx",
+        "flv",
+        "m4v",
+        "mkv",
+        "mov",
+        "mp4",
+        "mpeg",
+        "mpg",
+        "ogv",
+        "rm",
+        "ts",
+        "vob",
+        "webm",
+        "wmv",
+    }
+)
 
-SUPPORTED_AUDIO_FORMATS = {
-    "m4a",
-    "mp3",
-    "ogg",
-    "wav",
-}
+# Video containers whose streams can be copied into an 'mp4' clip without re-encoding.
+STREAM_COPY_VIDEO_FORMATS = frozenset(
+    {
+        "m4v",
+        "mov",
+        "mp4",
+    }
+)
 
-SUPPORTED_IMAGE_FORMATS = {
-    "bmp",
-    "dib",
-    "jp2",
-    "jpeg",
-    "jpg",
-    "png",
-    "tif",
-    "tiff",
-    "webp",
-}
+SUPPORTED_AUDIO_FORMATS = frozenset(
+    {
+        "m4a",
+        "mp3",
+        "ogg",
+        "wav",
+    }
+)
+
+SUPPORTED_IMAGE_FORMATS = frozenset(
+    {
+        "bmp",
+        "dib",
+        "jp2",
+        "jpeg",
+        "jpg",
+        "png",
+        "tif",
+        "tiff",
+        "webp",
+    }
+)
 
-VALID_ROTATE_VALUES = {0, 90, 180, 270}
+# Most bytes of decoded RGB frames a clip may hold in memory to be reversed or bounced
+# in one pass. Longer or larger clips are read backwards instead, which is slower.
+RESEQUENCE_MAX_BYTES = 1024**3
 
-ROTATION_MAP = {
-    90: cv2.ROTATE_90_CLOCKWISE,
-    180: cv2.ROTATE_180,
-    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+# Most images each frame extraction worker queues for writing at once. Each one holds a
+# decoded frame, so this bounds memory independently of the number of cores.
+MAX_PENDING_IMAGES = 4
+
+VALID_ROTATE_VALUES = frozenset({0, 90, 180, 270})
+
+# OpenCV rotate codes indexed by `degrees // 90`, None meaning no rotation. The values
+# are those of `cv2.ROTATE_90_CLOCKWISE`, `cv2.ROTATE_180` and
+# `cv2.ROTATE_90_COUNTERCLOCKWISE`, spelled out so importing this doesn't load OpenCV.
+ROTATE_CODES = (None, 0, 1, 2)
+
+SUPPORTED_HWACCELS = frozenset(
+    {
+        "cuda",
+        "qsv",
+        "vaapi",
+        "videotoolbox",
+    }
+)
+
+HWACCEL_ENCODERS = {
+    "cuda": "h264_nvenc",
+    "qsv": "h264_qsv",
+    "vaapi": "h264_vaapi",
+    "videotoolbox": "h264_videotoolbox",
 }
+
+HWACCEL_FFMPEG_PARAMS = {
+    "vaapi": ["-vf", "format=nv12,hwupload"],
+}
+
+# The VAAPI render device is read from this environment variable when encoding, so
+# hosts with several GPUs can pick one. Defaults to the first render node.
+VAAPI_DEVICE_ENV_VAR = "VIDEOXT_VAAPI_DEVICE"
+DEFAULT_VAAPI_DEVICE = "/dev/dri/renderD128"
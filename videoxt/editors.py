@@ -1,25 +1,36 @@
-"""Contains functions used to edit a VideoFileClip or np.ndarray prior to extraction."""
+"""Contains functions used to edit a moviepy clip or np.ndarray prior to extraction."""
 from typing import Any
 
 import cv2  # type: ignore
 import numpy as np
 from moviepy.editor import afx  # type: ignore
-from moviepy.editor import VideoFileClip, vfx
+from moviepy.editor import (  # type: ignore
+    AudioFileClip,
+    ImageSequenceClip,
+    VideoFileClip,
+    concatenate_audioclips,
+    vfx,
+)
 
 import videoxt.constants as C
 
+# Averages the three color channels of a frame into each output channel, matching the
+# weights of `moviepy.editor.vfx.blackwhite`.
+_MONOCHROME_MATRIX = np.full((3, 3), 1 / 3, dtype=np.float32)
+
 
 def trim_clip(
-    clip: VideoFileClip,
+    clip: VideoFileClip | AudioFileClip,
     start_second: float | None = None,
     stop_second: float | None = None,
-) -> VideoFileClip:
+) -> VideoFileClip | AudioFileClip:
     """
-    Trim a VideoFileClip to a specific time range and return the trimmed clip.
+    Trim a VideoFileClip or AudioFileClip to a specific time range and return the
+    trimmed clip.
 
     Args:
     -----
-        `clip` (moviepy.editor.VideoFileClip):
+        `clip` (moviepy.editor.VideoFileClip | moviepy.editor.AudioFileClip):
             The clip to trim.
         `start_second` (float | None):
             The start time in seconds. If None, the trim will start at the beginning.
@@ -28,7 +39,15 @@ def trim_clip(
 
     Returns:
     -----
-        `moviepy.editor.VideoFileClip`: The trimmed clip.
+        `moviepy.editor.VideoFileClip | moviepy.editor.AudioFileClip`:
+            The trimmed clip.
+
+    Notes:
+    -----
+        - When trimming from a start second greater than 0, the ffmpeg pipe the clip's
+        reader opened at t=0 is closed. The next frame read reopens the pipe with an
+        input seek (`-ss` before `-i`), jumping to the nearest keyframe instead of
+        decoding and discarding the frames leading up to the start second.
     """
     if start_second is None and stop_second is None:
         return clip
@@ -39,21 +58,24 @@ def trim_clip(
     if stop_second is None:
         stop_second = clip.duration
 
+    if start_second > 0 and isinstance(clip, VideoFileClip):
+        clip.reader.close()
+
     return clip.subclip(start_second, stop_second)
 
 
 def edit_clip_audio(
-    clip: VideoFileClip,
+    clip: VideoFileClip | AudioFileClip,
     volume: float | None = None,
     normalize: bool | None = None,
-) -> VideoFileClip:
+) -> VideoFileClip | AudioFileClip:
     """
-    Edit the audio of a VideoFileClip by adjusting its volume and normalizing the
-    audio if specified and return the edited clip.
+    Edit the audio of a VideoFileClip or AudioFileClip by adjusting its volume and
+    normalizing the audio if specified and return the edited clip.
 
     Args:
     -----
-        `clip` (moviepy.editor.VideoFileClip):
+        `clip` (moviepy.editor.VideoFileClip | moviepy.editor.AudioFileClip):
             The clip to edit.
         `volume` (float | None):
             The volume multiplier. If None, the volume will not be adjusted.
@@ -62,7 +84,8 @@ def edit_clip_audio(
 
     Returns:
     -----
-        `moviepy.editor.VideoFileClip`: The edited clip.
+        `moviepy.editor.VideoFileClip | moviepy.editor.AudioFileClip`:
+            The edited clip.
     """
     if normalize:
         clip = clip.fx(afx.audio_normalize)
@@ -98,15 +121,22 @@ def edit_clip_image(
     Returns:
     -----
         `moviepy.editor.VideoFileClip`: The edited clip.
+
+    Notes:
+    -----
+        - The clip is resized first, so rotating and the monochrome filter only touch
+        the resized pixels of each frame.
+        - No resize is done if the clip already has the requested dimensions, e.g.
+        when it was opened with `videoxt.video.open_video_clip`.
     """
-    if dimensions is not None:
+    if dimensions is not None and tuple(clip.size) != tuple(dimensions):
         clip = clip.resize(dimensions)
 
     if rotate != 0:
         clip = clip.rotate(rotate)
 
     if monochrome:
-        clip = clip.fx(vfx.blackwhite)
+        clip = clip.fl_image(monochrome_frame)
 
     return clip
 
@@ -135,12 +165,122 @@ def edit_clip_motion(
     Returns:
     -----
         `moviepy.editor.VideoFileClip`: The edited clip.
+
+    Notes:
+    -----
+        - Reversing or bouncing decodes the clip's frames once, front to back, and
+        reorders them in memory (see `resequence_clip`). Read backwards, every frame
+        would restart ffmpeg with a new seek.
+        - Clips whose decoded frames would exceed `C.RESEQUENCE_MAX_BYTES` are read
+        backwards anyway, with `vfx.time_mirror` and `vfx.time_symmetrize`, so that
+        memory stays bounded.
+    """
+    if (reverse or bounce) and estimate_frames_bytes(clip) <= C.RESEQUENCE_MAX_BYTES:
+        clip = resequence_clip(clip, reverse, bounce)
+    else:
+        if reverse:
+            clip = clip.fx(vfx.time_mirror)
+
+        if bounce:
+            clip = clip.fx(vfx.time_symmetrize)
+
+    if speed != 1.0:
+        clip = clip.fx(vfx.speedx, speed)
+
+    return clip
+
+
+def estimate_frames_bytes(clip: VideoFileClip) -> int:
+    """
+    Return an estimate of the memory needed to hold every decoded RGB frame of a clip.
+
+    Args:
+    -----
+        `clip` (moviepy.editor.VideoFileClip): The clip to estimate.
+
+    Returns:
+    -----
+        `int`: The estimated number of bytes, `duration * fps * width * height * 3`.
+    """
+    width, height = clip.size
+    return int(clip.duration * clip.fps) * width * height * 3
+
+
+def resequence_clip(
+    clip: VideoFileClip,
+    reverse: bool | None = None,
+    bounce: bool | None = None,
+) -> ImageSequenceClip:
+    """
+    Reverse and/or bounce a VideoFileClip by decoding its frames once in playback order
+    and return a clip of the reordered frames. The clip's audio, if any, is reversed
+    and/or bounced to match.
+
+    Reordering only touches the list of frame references, the decoded frames themselves
+    are never copied. They are all held in memory though, see `estimate_frames_bytes`.
+    Resize the clip beforehand to keep the decoded frames small.
+
+    Args:
+    -----
+        `clip` (moviepy.editor.VideoFileClip):
+            The clip to reorder.
+        `reverse` (bool | None):
+            Whether to reverse the clip. If None, the clip will not be reversed.
+        `bounce` (bool | None):
+            Whether to bounce the clip. If None, the clip will not be bounced.
+
+    Returns:
+    -----
+        `moviepy.editor.ImageSequenceClip`: The reordered clip.
+    """
+    frames = list(clip.iter_frames())
+
+    if reverse:
+        frames.reverse()
+
+    if bounce:
+        frames += frames[::-1]
+
+    resequenced = ImageSequenceClip(frames, fps=clip.fps)
+
+    if clip.audio is not None:
+        resequenced = resequenced.set_audio(
+            edit_audio_clip_motion(clip.audio, 1.0, reverse, bounce)
+        )
+
+    return resequenced
+
+
+def edit_audio_clip_motion(
+    clip: AudioFileClip,
+    speed: float | None = None,
+    reverse: bool | None = None,
+    bounce: bool | None = None,
+) -> AudioFileClip:
+    """
+    Edit the moving properties of an AudioFileClip by adjusting its speed, reversing,
+    and bouncing if specified and return the edited clip.
+
+    Args:
+    -----
+        `clip` (moviepy.editor.AudioFileClip):
+            The clip to edit.
+        `speed` (float | None):
+            The speed multiplier. If None, the speed will not be adjusted.
+        `reverse` (bool | None):
+            Whether to reverse the clip. If None, the clip will not be reversed.
+        `bounce` (bool | None):
+            Whether to bounce the clip. If None, the clip will not be bounced.
+
+    Returns:
+    -----
+        `moviepy.editor.AudioFileClip`: The edited clip.
     """
     if reverse:
         clip = clip.fx(vfx.time_mirror)
 
     if bounce:
-        clip = clip.fx(vfx.time_symmetrize)
+        clip = concatenate_audioclips([clip, clip.fx(vfx.time_mirror)])
 
     if speed != 1.0:
         clip = clip.fx(vfx.speedx, speed)
@@ -148,6 +288,24 @@ def edit_clip_motion(
     return clip
 
 
+def monochrome_frame(frame: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """
+    Return a black-and-white copy of a 3-channel `uint8` clip frame.
+
+    The channels are averaged in a single `cv2.transform` call that reads and writes
+    `uint8` directly, instead of building float planes and casting them back per frame.
+
+    Args:
+    -----
+        `frame` (np.ndarray[Any, Any]): The frame to convert.
+
+    Returns:
+    -----
+        `np.ndarray[Any, Any]`: The black-and-white frame, still with 3 channels.
+    """
+    return cv2.transform(frame, _MONOCHROME_MATRIX)
+
+
 def edit_image(
     image: np.ndarray[Any, Any],
     dimensions: tuple[int, int] | None = None,
@@ -174,17 +332,24 @@ def edit_image(
     Returns:
     -----
         `np.ndarray[Any, Any]`: The edited image.
-    """
-    if dimensions is not None and dimensions != image.shape:
-        image = cv2.resize(image, dimensions)
 
-    if rotate != 0 and rotate is not None:
-        try:
-            rotate_value = C.ROTATION_MAP[rotate]
-        except KeyError:
-            pass  # XXX: log
-        else:
-            image = cv2.rotate(image, rotate_value)
+    Notes:
+    -----
+        - The image is resized first, so rotating and the monochrome conversion only
+        touch the resized pixels. Downscaling uses `cv2.INTER_AREA`, and the resize is
+        skipped when `dimensions` already match the image.
+    """
+    if dimensions is not None:
+        height, width = image.shape[:2]
+        if dimensions != (width, height):
+            interpolation = (
+                cv2.INTER_AREA if dimensions[0] < width else cv2.INTER_LINEAR
+            )
+            image = cv2.resize(image, dimensions, interpolation=interpolation)
+
+    # Only quarter turns have a rotate code, other values are ignored.
+    if rotate is not None and 0 < rotate < 360 and rotate % 90 == 0:
+        image = cv2.rotate(image, C.ROTATE_CODES[rotate // 90])
 
     if monochrome:
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -1,13 +1,22 @@
 """This module contains extractor objects that perform extractions."""
+import math
+import os
+import queue
+import threading
+from collections import deque
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
 
 import cv2  # type: ignore
 import numpy as np
-from moviepy.editor import VideoFileClip  # type: ignore
+from moviepy.config import get_setting  # type: ignore
+from moviepy.editor import AudioFileClip, VideoFileClip  # type: ignore
+from moviepy.tools import subprocess_call  # type: ignore
 
+import videoxt.constants as C
 import videoxt.editors as E
 import videoxt.requestors as R
 from videoxt.exceptions import (
@@ -19,7 +28,7 @@ from videoxt.exceptions import (
     GifWriteError,
     VideoCaptureSetError,
 )
-from videoxt.video import open_video_capture
+from videoxt.video import open_video_capture, open_video_clip
 
 
 class Extractor(Protocol):
@@ -75,27 +84,28 @@ class AudioExtractor:  # XXX: Optimize.
             `Path | None`:
                 The path to the extracted audio file if the write was successful.
         """
-        with VideoFileClip(str(self.request.video.filepath)) as clip:
+        # Only the audio stream is opened; no video frames are decoded or piped.
+        with AudioFileClip(str(self.request.video.filepath), fps=44100) as clip:
             subclip = self._edit_clip_audio(clip)
             return self._write_audio_file(subclip)
 
-    def _edit_clip_audio(self, clip: VideoFileClip) -> VideoFileClip:
+    def _edit_clip_audio(self, clip: AudioFileClip) -> AudioFileClip:
         """
         Apply optional edits to a clip before writing to disk as an audio file.
 
         Args:
         -----
-            `clip` (moviepy.editor.VideoFileClip): The clip to apply edits to.
+            `clip` (moviepy.editor.AudioFileClip): The clip to apply edits to.
 
         Returns:
         -----
-            `moviepy.editor.VideoFileClip`: The clip with edits applied.
+            `moviepy.editor.AudioFileClip`: The clip with edits applied.
         """
         start: float | None = self.request.extraction_range.get("start_second", None)
         stop: float | None = self.request.extraction_range.get("stop_second", None)
         clip = E.trim_clip(clip, start, stop)
 
-        clip = E.edit_clip_motion(
+        clip = E.edit_audio_clip_motion(
             clip, self.request.speed, self.request.reverse, self.request.bounce
         )
 
@@ -103,9 +113,9 @@ class AudioExtractor:  # XXX: Optimize.
 
         return clip
 
-    def _write_audio_file(self, subclip: VideoFileClip) -> Path:
+    def _write_audio_file(self, subclip: AudioFileClip) -> Path:
         """
-        Write the audio from a subclip to disk and return the path to the audio file.
+        Write an audio subclip to disk and return the path to the audio file.
 
         Returns:
         -----
@@ -118,9 +128,7 @@ class AudioExtractor:  # XXX: Optimize.
                 If the audio file could not be written to disk (from OSError).
         """
         try:
-            subclip.audio.write_audiofile(
-                str(self.request.destpath), logger=None, fps=44100
-            )
+            subclip.write_audiofile(str(self.request.destpath), logger=None, fps=44100)
         except OSError as e:
             raise AudioWriteError(
                 f"Error writing audio to {self.request.destpath}"
@@ -162,15 +170,90 @@ class ClipExtractor:  # XXX: Optimize.
         Extract a subclip from a video within a given time range and return the file
         path to clip. Optional edits to the clip are applied before saving to disk.
 
+        If the clip starts at the beginning of the video and no edits are requested,
+        the streams are copied into the clip as they are (see `_copy_subclip`), which
+        skips decoding and re-encoding entirely.
+
         Returns:
         -----
             `Path`:
                 The path to the extracted clip if the write was successful.
         """
-        with VideoFileClip(str(self.request.video.filepath)) as clip:
+        if self._is_stream_copyable():
+            try:
+                return self._copy_subclip()
+            except OSError:
+                pass  # XXX: log. Fall back to decoding and re-encoding below.
+
+        with open_video_clip(
+            self.request.video.filepath, self.request.dimensions
+        ) as clip:
             subclip = self._edit_clip(clip)
             return self._write_subclip(subclip)
 
+    def _is_stream_copyable(self) -> bool:
+        """
+        Return True if the request only cuts the video from its beginning, i.e. no edit
+        changes a frame or audio sample and the video's container can be copied into a
+        'mp4' as is.
+
+        Cuts starting later are re-encoded: a stream copy can only start on a keyframe,
+        which may lie seconds before the requested start time.
+        """
+        request = self.request
+        return (
+            not request.extraction_range.get("start_second")
+            and request.video.filepath.suffix.lower().lstrip(".")
+            in C.STREAM_COPY_VIDEO_FORMATS
+            and request.dimensions in (None, request.video.dimensions)
+            and not request.rotate
+            and not request.monochrome
+            and request.speed in (None, 1.0)
+            and not request.reverse
+            and not request.bounce
+            and request.volume in (None, 1.0)
+            and not request.normalize
+            and request.hwaccel is None
+        )
+
+    def _copy_subclip(self) -> Path:
+        """
+        Cut the requested range out of the video with ffmpeg, copying the video and
+        audio streams instead of decoding and re-encoding them, and return the path to
+        the clip.
+
+        Returns:
+        -----
+            `Path`:
+                The path to the extracted clip if the copy was successful.
+
+        Raises:
+        -----
+            `OSError`: If ffmpeg failed to copy the streams.
+        """
+        stop: float = self.request.extraction_range.get(
+            "stop_second", self.request.video.duration_seconds
+        )
+        subprocess_call(
+            [
+                get_setting("FFMPEG_BINARY"),
+                "-y",
+                "-i",
+                str(self.request.video.filepath),
+                "-t",
+                f"{stop:.6f}",
+                "-map",
+                "0:v:0",
+                "-map",
+                "0:a?",
+                "-c",
+                "copy",
+                str(self.request.destpath),
+            ],
+            logger=None,
+        )
+        return self.request.destpath
+
     def _edit_clip(self, clip: VideoFileClip) -> VideoFileClip:
         """
         Apply optional edits to a clip before writing to disk as a 'mp4' file.
@@ -189,20 +272,23 @@ class ClipExtractor:  # XXX: Optimize.
 
         clip = E.edit_clip_audio(clip, self.request.volume, self.request.normalize)
 
-        clip = E.edit_clip_motion(
-            clip, self.request.speed, self.request.reverse, self.request.bounce
-        )
-
         clip = E.edit_clip_image(
             clip, self.request.dimensions, self.request.rotate, self.request.monochrome
         )
 
+        clip = E.edit_clip_motion(
+            clip, self.request.speed, self.request.reverse, self.request.bounce
+        )
+
         return clip
 
     def _write_subclip(self, subclip: VideoFileClip) -> Path:
         """
         Write a subclip to disk and return the path to the clip.
 
+        If a hardware acceleration method was requested, the clip is encoded with the
+        matching hardware H.264 encoder instead of 'libx264'.
+
         Returns:
         -----
             `Path`:
@@ -212,8 +298,14 @@ class ClipExtractor:  # XXX: Optimize.
         -----
             `ClipWriteError`: If the clip could not be written to disk (from OSError).
         """
+        hwaccel = self.request.hwaccel
         try:
-            subclip.write_videofile(str(self.request.destpath), logger=None)
+            subclip.write_videofile(
+                str(self.request.destpath),
+                codec=C.HWACCEL_ENCODERS.get(hwaccel, "libx264"),
+                ffmpeg_params=self._hwaccel_ffmpeg_params(),
+                logger=None,
+            )
         except OSError as e:
             raise ClipWriteError(
                 f"Error writing clip to {self.request.destpath}"
@@ -221,6 +313,21 @@ class ClipExtractor:  # XXX: Optimize.
         else:
             return self.request.destpath
 
+    def _hwaccel_ffmpeg_params(self) -> list[str] | None:
+        """
+        Return the extra ffmpeg parameters the requested hardware encoder needs, if
+        any. 'vaapi' encodes on the render device named by the `VIDEOXT_VAAPI_DEVICE`
+        environment variable, '/dev/dri/renderD128' if it isn't set.
+        """
+        hwaccel = self.request.hwaccel
+        ffmpeg_params = C.HWACCEL_FFMPEG_PARAMS.get(hwaccel)
+
+        if hwaccel == "vaapi" and ffmpeg_params is not None:
+            device = os.environ.get(C.VAAPI_DEVICE_ENV_VAR, C.DEFAULT_VAAPI_DEVICE)
+            ffmpeg_params = ["-vaapi_device", device, *ffmpeg_params]
+
+        return ffmpeg_params
+
 
 @dataclass
 class FramesExtractor:  # XXX: Optimize.
@@ -239,6 +346,9 @@ class FramesExtractor:  # XXX: Optimize.
         `extract()` -> `Path`:
             Execute frames extraction and return the path to the directory where the
             extracted images were saved.
+        `iter_frames()` -> `Generator[tuple[int, np.ndarray[Any, Any]], None, None]`:
+            Yield the frame number and edited frame of each frame to extract, without
+            writing any images to disk.
     """
 
     request: R.PreparedFramesRequest
@@ -266,10 +376,20 @@ class FramesExtractor:  # XXX: Optimize.
 
         from rich.progress import track
 
-        # Open the video capture and iterate over the frames to write to disk.
-        with open_video_capture(self.request.video.filepath) as opencap:
-            for edited_frame, image_path in track(
-                self._preprocess_frames(opencap),
+        # Split the frames to extract between workers, one video capture per worker.
+        frame_ranges = self._split_frame_numbers()
+
+        # Encode and write the images on a pool of threads shared by every worker, so
+        # decoding the next frames overlaps with compressing the previous ones.
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as encoders:
+            written_images = (
+                self._write_frames(frame_ranges[0], encoders)
+                if len(frame_ranges) == 1
+                else self._write_frames_concurrently(frame_ranges, encoders)
+            )
+
+            for _ in track(
+                written_images,
                 total=self.request.images_expected,
                 transient=True,
                 description=(
@@ -277,32 +397,241 @@ class FramesExtractor:  # XXX: Optimize.
                     "Press [red][bold]Ctrl+C[/red][/bold] to cancel."
                 ),
             ):
-                self._write_image(edited_frame, image_path)
+                pass
 
         return self.request.destpath
 
+    def _write_frames(
+        self,
+        frame_numbers: list[int],
+        encoders: ThreadPoolExecutor,
+        cancel: threading.Event | None = None,
+    ) -> Generator[Path, None, None]:
+        """
+        Open a video capture, write the frames to disk as images and yield the path of
+        each image written.
+
+        Args:
+        -----
+            `frame_numbers` (list[int]):
+                The ascending frame numbers to extract.
+            `encoders` (ThreadPoolExecutor):
+                The pool of threads encoding and writing the images.
+            `cancel` (threading.Event | None):
+                If set, stop writing frames.
+
+        Yields:
+        -----
+            `Path`: The path of the image written, in frame order.
+
+        Notes:
+        -----
+            - `cv2` releases the GIL while encoding and writing an image, so the
+            encoders run in parallel with each other and with decoding.
+            - At most `MAX_PENDING_IMAGES` images are queued at once. This bounds
+            memory and guarantees a frame buffer is written before it is decoded into
+            again.
+        """
+        max_pending = C.MAX_PENDING_IMAGES
+        pending: deque[tuple[Future[None], Path]] = deque()
+
+        with open_video_capture(self.request.video.filepath) as opencap:
+            try:
+                for edited_frame, image_path in self._preprocess_frames(
+                    opencap, frame_numbers, n_buffers=max_pending + 1
+                ):
+                    if cancel is not None and cancel.is_set():
+                        return
+                    future = encoders.submit(
+                        self._write_image, edited_frame, image_path
+                    )
+                    pending.append((future, image_path))
+                    if len(pending) == max_pending:
+                        yield self._wait_for_image(*pending.popleft())
+
+                while pending:
+                    yield self._wait_for_image(*pending.popleft())
+
+            finally:
+                for future, _ in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _wait_for_image(future: Future[None], image_path: Path) -> Path:
+        """
+        Wait for an image to be written and return its path.
+
+        Args:
+        -----
+            `future` (Future[None]):
+                The pending `_write_image` call.
+            `image_path` (Path):
+                The path the image is being written to.
+
+        Returns:
+        -----
+            `Path`: The path of the image written.
+
+        Raises:
+        -----
+            `FrameWriteError`: If the image could not be written.
+        """
+        future.result()
+        return image_path
+
+    def _write_frames_concurrently(
+        self, frame_ranges: list[list[int]], encoders: ThreadPoolExecutor
+    ) -> Generator[Path, None, None]:
+        """
+        Write each range of frames to disk in its own thread and yield the path of each
+        image written, in the order the images were written.
+
+        Args:
+        -----
+            `frame_ranges` (list[list[int]]):
+                The ascending frame numbers to extract, one list per worker.
+            `encoders` (ThreadPoolExecutor):
+                The pool of threads encoding and writing the images.
+
+        Yields:
+        -----
+            `Path`: The path of the image written.
+
+        Notes:
+        -----
+            - `cv2` releases the GIL while decoding, so the threads decode in parallel.
+            - Worker errors are re-raised once every worker has stopped.
+        """
+        written: queue.Queue[Path | None] = queue.Queue()
+        cancel = threading.Event()
+
+        def worker(frame_numbers: list[int]) -> None:
+            try:
+                for image_path in self._write_frames(frame_numbers, encoders, cancel):
+                    written.put(image_path)
+            except BaseException:
+                cancel.set()
+                raise
+            finally:
+                written.put(None)
+
+        with ThreadPoolExecutor(max_workers=len(frame_ranges)) as executor:
+            futures = [executor.submit(worker, fr) for fr in frame_ranges]
+            try:
+                workers_running = len(futures)
+                while workers_running:
+                    image_path = written.get()
+                    if image_path is None:
+                        workers_running -= 1
+                    else:
+                        yield image_path
+            finally:
+                cancel.set()
+
+        for future in futures:
+            future.result()
+
+    def iter_frames(self) -> Generator[tuple[int, np.ndarray[Any, Any]], None, None]:
+        """
+        Decode and edit the frames to extract and yield each one with its frame number,
+        without writing any images to disk.
+
+        Yields:
+        -----
+            `tuple[int, np.ndarray[Any, Any]]`:
+                The frame number (0-based) and the edited frame. Each frame is a new
+                array the caller is free to keep.
+        """
+        with open_video_capture(self.request.video.filepath) as opencap:
+            yield from self._edit_frames(opencap, list(self._generate_frame_numbers()))
+
     def _preprocess_frames(
-        self, opencap: cv2.VideoCapture
+        self, opencap: cv2.VideoCapture, frame_numbers: list[int], n_buffers: int = 0
     ) -> Generator[tuple[np.ndarray[Any, Any], Path], None, None]:
         """
         Edit the frames to be extracted and yield the image path and the edited frame.
 
         Args:
         -----
-            `opencap` (cv2.VideoCapture): The open video capture to read from.
+            `opencap` (cv2.VideoCapture):
+                The open video capture to read from.
+            `frame_numbers` (list[int]):
+                The ascending frame numbers to extract.
+            `n_buffers` (int):
+                The number of frame buffers to decode into in turn. See `_edit_frames`.
 
         Yields:
         -----
             `tuple[Path, np.ndarray[Any, Any]]`:
                 A tuple containing the image path and frame.
         """
+        for frame_num, edited_frame in self._edit_frames(
+            opencap, frame_numbers, n_buffers
+        ):
+            yield edited_frame, self._build_image_path(frame_num)
+
+    def _edit_frames(
+        self,
+        opencap: cv2.VideoCapture,
+        frame_numbers: list[int],
+        n_buffers: int = 0,
+    ) -> Generator[tuple[int, np.ndarray[Any, Any]], None, None]:
+        """
+        Read and edit the frames to be extracted and yield each frame number and edited
+        frame.
+
+        Args:
+        -----
+            `opencap` (cv2.VideoCapture):
+                The open video capture to read from.
+            `frame_numbers` (list[int]):
+                The ascending frame numbers to extract.
+            `n_buffers` (int):
+                If positive, frames are decoded into reused buffers. Edits copy the
+                frame, so while frames are edited a single buffer is reused. Frames
+                yielded unedited rotate through up to `n_buffers` buffers, so each is
+                overwritten `n_buffers` unedited frames later. Only use it when each
+                frame is consumed by then. If 0, every frame is decoded into a new
+                array.
+
+        Yields:
+        -----
+            `tuple[int, np.ndarray[Any, Any]]`:
+                A tuple containing the frame number and the edited frame.
+        """
+        if not frame_numbers:
+            return
+
+        # Seek once to the first frame, then decode sequentially from there on.
+        self._seek_video_frame(opencap, frame_numbers[0])
+
+        # Reuse buffers instead of allocating an array per frame. They are allocated on
+        # first use, so edited frames only ever allocate one.
+        width, height = self.request.video.dimensions
+        frame_buffers: list[np.ndarray[Any, Any]] = []
+        buffer_index = 0
+
         # Iterate over the range of frames to extract.
-        for frame_num in self._generate_frame_numbers():
-            # Build the image path, read video frame, apply edits, yield path and frame.
-            frame = self._read_video_frame(opencap, frame_num)
+        previous_frame_num = frame_numbers[0] - 1
+        for frame_num in frame_numbers:
+            frame_buffer = None
+            if n_buffers:
+                if buffer_index == len(frame_buffers):
+                    frame_buffers.append(np.empty((height, width, 3), dtype=np.uint8))
+                frame_buffer = frame_buffers[buffer_index]
+
+            # Skip the frames between captures, then read the frame to extract.
+            skip = frame_num - previous_frame_num - 1
+            frame = self._read_video_frame(
+                opencap, frame_num, skip=skip, out=frame_buffer
+            )
+            previous_frame_num = frame_num
             edited_frame = self._edit_video_frame(frame)
-            image_path = self._build_image_path(frame_num)
-            yield edited_frame, image_path
+
+            # Only move on to the next buffer if this one is handed out unedited.
+            if n_buffers and edited_frame is frame:
+                buffer_index = (buffer_index + 1) % n_buffers
+            yield frame_num, edited_frame
 
     def _generate_frame_numbers(self) -> Generator[int, None, None]:
         start_frame = self.request.extraction_range.get("start_frame", 0)
@@ -318,6 +647,22 @@ class FramesExtractor:  # XXX: Optimize.
             current_frame += capture_rate
             images_expected -= 1
 
+    def _split_frame_numbers(self) -> list[list[int]]:
+        """
+        Split the frame numbers to extract into contiguous ranges, one per worker.
+
+        Returns:
+        -----
+            `list[list[int]]`:
+                Up to `n_workers` lists of ascending frame numbers of near-equal length.
+        """
+        frame_numbers = list(self._generate_frame_numbers())
+        n_workers = max(1, min(self.request.n_workers, len(frame_numbers)))
+        size = math.ceil(len(frame_numbers) / n_workers) or 1
+        return [
+            frame_numbers[i : i + size] for i in range(0, len(frame_numbers), size)
+        ] or [[]]
+
     def _build_image_path(self, frame_num: int) -> Path:
         """
         Build the filepath for the next image to be written.
@@ -343,38 +688,31 @@ class FramesExtractor:  # XXX: Optimize.
             / f"{self.request.filename}_{frame_num+1}.{self.request.image_format}"
         )
 
-    def _read_video_frame(
-        self, opencap: cv2.VideoCapture, frame_num: int
-    ) -> np.ndarray[Any, Any]:
+    def _seek_video_frame(self, opencap: cv2.VideoCapture, frame_num: int) -> None:
         """
-        Point the video capture to the frame number to read (0-based index) and return
-        a `np.ndarray[Any, Any]` representing the video frame.
+        Point the video capture to the frame number to read next (0-based index).
 
         Args:
         -----
             `opencap` (cv2.VideoCapture):
-                The open video capture to read from.
+                The open video capture to seek.
             `frame_num` (int):
-                The frame number to read.
-
-        Returns:
-        -----
-            `np.ndarray[Any, Any]`: The video frame from the capture.
+                The frame number to seek to.
 
         Raises:
         -----
             `VideoCaptureSetError`:
                 If opencap.set(cv2.CAP_PROP_POS_FRAMES, frame_num) returns False.
-            `FrameReadError`:
-                If opencap.read() could not grab, decode and return the frame.
 
         Notes:
         -----
             - set() uses a 0-based index of the frame to be decoded/captured next.
             - set() returns True if the capture device has accepts the property value,
             even if property value remains unchanged.
-            - read() returns a tuple of (bool, np.ndarray[Any, Any]).
         """
+        if frame_num == 0:
+            return
+
         set_successful = opencap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
         if not set_successful:
             raise VideoCaptureSetError(
@@ -382,9 +720,54 @@ class FramesExtractor:  # XXX: Optimize.
                 f"capture to frame number {frame_num}."
             )
 
+    def _read_video_frame(
+        self,
+        opencap: cv2.VideoCapture,
+        frame_num: int,
+        skip: int = 0,
+        out: np.ndarray[Any, Any] | None = None,
+    ) -> np.ndarray[Any, Any]:
+        """
+        Advance the video capture past `skip` frames without decoding them and return
+        a `np.ndarray[Any, Any]` representing the next decoded video frame.
+
+        Args:
+        -----
+            `opencap` (cv2.VideoCapture):
+                The open video capture to read from.
+            `frame_num` (int):
+                The frame number to read, used in error messages.
+            `skip` (int):
+                The number of frames to grab and discard before reading.
+            `out` (np.ndarray[Any, Any] | None):
+                Optional buffer to decode the frame into. A new array is allocated if
+                None or if its shape or dtype doesn't match the decoded frame.
+
+        Returns:
+        -----
+            `np.ndarray[Any, Any]`: The video frame from the capture.
+
+        Raises:
+        -----
+            `FrameReadError`:
+            - If opencap.grab() could not grab a skipped frame.
+            - If opencap.read() could not grab, decode and return the frame.
+
+        Notes:
+        -----
+            - grab() demuxes the next frame without the cost of decoding it.
+            - read() returns a tuple of (bool, np.ndarray[Any, Any]).
+        """
+        for _ in range(skip):
+            if not opencap.grab():
+                raise FrameReadError(
+                    f"Could not grab frames preceding frame {frame_num} from video "
+                    "capture."
+                )
+
         read_successful: bool
         frame: np.ndarray[Any, Any]
-        read_successful, frame = opencap.read()
+        read_successful, frame = opencap.read(out)
         if not read_successful:
             raise FrameReadError(
                 f"Could not read frame {frame_num} from video capture."
@@ -474,7 +857,9 @@ class GifExtractor:  # XXX: Optimize.
             `Path`:
                 The path to the extracted gif if the write was successful.
         """
-        with VideoFileClip(str(self.request.video.filepath)) as clip:
+        with open_video_clip(
+            self.request.video.filepath, self.request.dimensions
+        ) as clip:
             subclip = self._edit_clip(clip)
             return self._write_gif(subclip)
 
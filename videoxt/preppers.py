@@ -1,5 +1,4 @@
 """Contains functions, objects that prepare shared request values for extraction."""
-import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -9,7 +8,7 @@ import videoxt.validators as V
 from videoxt.exceptions import PreparationError
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionRange:
     """
     Container for variations of the user's requested extraction range.
@@ -85,19 +84,22 @@ class ExtractionRange:
 
     def __post_init__(self) -> None:
         """
-        Start procedure that prepares and validates the extraction range.
-
-        - Convert the requested start and stop times to seconds (float)
-        - Validate the range against the video's duration
-        - Convert each request second to timestamps (str) and frame numbers (int).
+        Start procedure that prepares and validates the extraction range. See
+        `ExtractionRange.compute`.
         """
-        self._prepare_start_second()
-        self._prepare_stop_second()
-        self._validate_range()
-        self._prepare_start_timestamp()
-        self._prepare_stop_timestamp()
-        self._prepare_start_frame()
-        self._prepare_stop_frame()
+        extraction_range = self.compute(
+            self.duration_seconds,
+            self.frame_count,
+            self.start_time,
+            self.stop_time,
+            self.fps,
+        )
+        self.start_second = extraction_range["start_second"]
+        self.stop_second = extraction_range["stop_second"]
+        self.start_timestamp = extraction_range["start_timestamp"]
+        self.stop_timestamp = extraction_range["stop_timestamp"]
+        self.start_frame = extraction_range["start_frame"]
+        self.stop_frame = extraction_range["stop_frame"]
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary of the validated extraction start and stop points."""
@@ -110,64 +112,55 @@ class ExtractionRange:
             "stop_frame": self.stop_frame,
         }
 
-    def _prepare_start_second(self) -> float:
-        """Convert the start time requested to seconds (float)."""
-        self.start_second = (
-            float(self.start_time)
-            if isinstance(self.start_time, (float, int))
-            else U.timestamp_to_seconds(self.start_time)
-        )
-        return self.start_second
-
-    def _prepare_stop_second(self) -> float:
-        """Convert the stop time requested to seconds (float)."""
-        self.stop_second = (
-            float(self.stop_time)
-            if isinstance(self.stop_time, (float, int))
-            else U.timestamp_to_seconds(self.stop_time)
-        )
-
-        if self.stop_second > self.duration_seconds:
-            self.stop_second = self.duration_seconds
+    @staticmethod
+    def compute(
+        duration_seconds: float,
+        frame_count: int,
+        start_time: float | int | str,
+        stop_time: float | int | str,
+        fps: float,
+    ) -> dict[str, Any]:
+        """
+        Prepare and validate an extraction range and return the dictionary `to_dict`
+        would, without creating an `ExtractionRange`.
 
-        return self.stop_second
+        - Convert the requested start and stop times to seconds (float)
+        - Validate the range against the video's duration
+        - Convert each request second to timestamps (str) and frame numbers (int).
 
-    def _validate_range(self) -> tuple[float, float, float]:
-        """
-        Validate start and stop seconds against the video's duration and each other.
+        Args:
+        -----
+            See the fields of `ExtractionRange`.
 
         Returns:
         -----
-            `tuple[float, float, float]`: Validated (start, stop, duration) in seconds.
+            `dict[str, Any]`: Dictionary of validated extraction start and stop points.
+
+        Raises:
+        -----
+            `ValidationError`: If the range is invalid for the video's duration.
         """
-        start, stop, duration = V.valid_extraction_range(
-            self.start_second, self.stop_second, self.duration_seconds
-        )
-        return start, stop, duration
-
-    def _prepare_start_timestamp(self) -> str:
-        """Convert the start time requested to a timestamp (str) `HH:MM:SS`."""
-        self.start_timestamp = U.seconds_to_timestamp(self.start_second)
-        return self.start_timestamp
-
-    def _prepare_stop_timestamp(self) -> str:
-        """Convert the stop time requested to a timestamp (str) `HH:MM:SS`."""
-        self.stop_timestamp = U.seconds_to_timestamp(self.stop_second)
-        return self.stop_timestamp
-
-    def _prepare_start_frame(self) -> int:
-        """Convert the start time requested to a frame number (int)."""
-        self.start_frame = math.floor(self.start_second * self.fps)
-        return self.start_frame
-
-    def _prepare_stop_frame(self) -> int:
-        """Convert the stop time requested to a frame number (int)."""
-        self.stop_frame = (
-            self.frame_count
-            if self.stop_second is None
-            else math.floor(self.stop_second * self.fps)
-        )
-        return self.stop_frame
+        start_second = max(ExtractionRange._normalize_time(start_time), 0.0)
+        stop_second = min(ExtractionRange._normalize_time(stop_time), duration_seconds)
+        V.valid_extraction_range(start_second, stop_second, duration_seconds)
+
+        # Both seconds are non-negative, so truncating floors them.
+        return {
+            "start_second": start_second,
+            "stop_second": stop_second,
+            "start_timestamp": U.seconds_to_timestamp(start_second),
+            "stop_timestamp": U.seconds_to_timestamp(stop_second),
+            "start_frame": int(start_second * fps),
+            "stop_frame": int(stop_second * fps),
+        }
+
+    @staticmethod
+    def _normalize_time(time: float | int | str) -> float:
+        """Convert a requested time in seconds or as a timestamp to seconds (float)."""
+        if isinstance(time, str):
+            return U.timestamp_to_seconds(time)
+
+        return float(time)
 
 
 def prepare_extraction_range(
@@ -213,7 +206,7 @@ def prepare_extraction_range(
     ):
         raise PreparationError("Start time, stop time or fps are None.")
 
-    extraction_range = ExtractionRange(
+    return ExtractionRange.compute(
         duration_seconds=duration_seconds,
         frame_count=frame_count,
         start_time=prepared_start_time,
@@ -221,8 +214,6 @@ def prepare_extraction_range(
         fps=prepared_fps,
     )
 
-    return extraction_range.to_dict()
-
 
 def prepare_dimensions(
     video_dimensions: tuple[int, int],
@@ -302,6 +293,8 @@ def prepare_destpath(
         prepared_suffix if prepared_suffix.startswith(".") else f".{prepared_suffix}"
     )
     filename = f"{request_filename or video_filepath.stem}{suffix}"
+    # Joining with `/` is faster than concatenating strings and building a `Path`, and
+    # the concatenation would turn a `destdir` of '/' into '//name'.
     dest_path = base_dir / filename
 
     if prepared_overwrite is True and dest_path != video_filepath:
@@ -426,7 +419,8 @@ def prepare_images_expected(
     if start_frame is None or stop_frame is None or capture_rate is None:
         raise PreparationError("Start frame, stop frame or capture rate is None.")
 
-    try:
-        return math.ceil((stop_frame - start_frame) / capture_rate)
-    except ZeroDivisionError as e:
-        raise PreparationError("Capture rate is zero.") from e
+    if capture_rate == 0:
+        raise PreparationError("Capture rate is zero.")
+
+    # Ceiling division on ints, exact for any frame count unlike a float division.
+    return -(-(stop_frame - start_frame) // capture_rate)
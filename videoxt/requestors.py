@@ -376,6 +376,13 @@ class ClipRequest(BaseRequest):
             If True, normalize the audio. Normalization adjusts the gain of the audio to
             ensure consistent levels, preventing distortion and enhancing clarity in
             some cases. Defaults to False if not specified.
+        `hwaccel` (str | None):
+            Encode the clip with a hardware H.264 encoder. Allowed values: 'cuda',
+            'qsv', 'vaapi' or 'videotoolbox'. Defaults to None if not specified
+            (software encoding with 'libx264'). 'vaapi' encodes on the render device
+            in the `VIDEOXT_VAAPI_DEVICE` environment variable, '/dev/dri/renderD128'
+            if it isn't set.
+            See: `videoxt.constants.SUPPORTED_HWACCELS`.
 
     Public Methods
     -----
@@ -399,6 +406,7 @@ class ClipRequest(BaseRequest):
     monochrome: bool | None = None
     volume: float | None = None
     normalize: bool | None = None
+    hwaccel: str | None = None
 
     def validate(self) -> "ClipRequest":
         """Validate fields if specified and return a validated `ClipRequest`."""
@@ -408,6 +416,7 @@ class ClipRequest(BaseRequest):
         self._validate_rotate()
         self._validate_speed()
         self._validate_volume()
+        self._validate_hwaccel()
         self._is_validated = True
         return self
 
@@ -447,6 +456,7 @@ class ClipRequest(BaseRequest):
             monochrome=self.monochrome,
             volume=self.volume,
             normalize=self.normalize,
+            hwaccel=self.hwaccel,
         )
         p.prepare()
         return p
@@ -478,6 +488,11 @@ class ClipRequest(BaseRequest):
         self.volume = None if self.volume is None else V.valid_volume(self.volume)
         return self.volume
 
+    def _validate_hwaccel(self) -> str | None:
+        """Validate the requested hardware acceleration method if specified."""
+        self.hwaccel = None if self.hwaccel is None else V.valid_hwaccel(self.hwaccel)
+        return self.hwaccel
+
 
 @dataclass
 class FramesRequest(BaseRequest):
@@ -532,6 +547,9 @@ class FramesRequest(BaseRequest):
         `monochrome` (bool | None):
             If True, apply a black-and-white filter to the images. Defaults to False if
             not specified.
+        `n_workers` (int | None):
+            Split the frames to extract between `n` threads, each decoding its own
+            contiguous range of the video. Defaults to 1 if not specified.
 
     Public Methods
     -----
@@ -553,6 +571,7 @@ class FramesRequest(BaseRequest):
     resize: float | None = None
     rotate: int | None = None
     monochrome: bool | None = None
+    n_workers: int | None = None
 
     def validate(self) -> "FramesRequest":
         """Validate fields if specified and return a validated `FramesRequest`."""
@@ -562,6 +581,7 @@ class FramesRequest(BaseRequest):
         self._validate_resize()
         self._validate_dimensions()
         self._validate_rotate()
+        self._validate_n_workers()
         self._is_validated = True
         return self
 
@@ -598,6 +618,7 @@ class FramesRequest(BaseRequest):
             resize=self.resize,
             rotate=self.rotate,
             monochrome=self.monochrome,
+            n_workers=self.n_workers,
         )
         p.prepare()
         return p
@@ -636,6 +657,13 @@ class FramesRequest(BaseRequest):
         self.rotate = None if self.rotate is None else V.valid_rotate_value(self.rotate)
         return self.rotate
 
+    def _validate_n_workers(self) -> int | None:
+        """Validate the requested number of workers if specified."""
+        self.n_workers = (
+            None if self.n_workers is None else V.positive_int(self.n_workers)
+        )
+        return self.n_workers
+
 
 @dataclass
 class GifRequest(BaseRequest):
@@ -1168,6 +1196,13 @@ class PreparedClipRequest(PreparedBaseRequest):
             If True, normalize the audio. Normalization adjusts the gain of the audio to
             ensure consistent levels, preventing distortion and enhancing clarity in
             some cases. Defaults to False if not specified.
+        `hwaccel` (str | None):
+            Encode the clip with a hardware H.264 encoder. Allowed values: 'cuda',
+            'qsv', 'vaapi' or 'videotoolbox'. Defaults to None if not specified
+            (software encoding with 'libx264'). 'vaapi' encodes on the render device
+            in the `VIDEOXT_VAAPI_DEVICE` environment variable, '/dev/dri/renderD128'
+            if it isn't set.
+            See: `videoxt.constants.SUPPORTED_HWACCELS`.
 
     Public Methods
     -----
@@ -1194,6 +1229,7 @@ class PreparedClipRequest(PreparedBaseRequest):
     monochrome: bool | None = None
     volume: float | None = None
     normalize: bool | None = None
+    hwaccel: str | None = None
 
     def prepare(self) -> "PreparedClipRequest":
         """
@@ -1334,6 +1370,9 @@ class PreparedFramesRequest(PreparedBaseRequest):
         `monochrome` (bool | None):
             If True, apply a black-and-white filter to the images. Defaults to False if
             not specified.
+        `n_workers` (int | None):
+            Split the frames to extract between `n` threads, each decoding its own
+            contiguous range of the video. Defaults to 1 if not specified.
         `images_expected` (int):
             The number of images expected to be written to disk. Not initialized.
 
@@ -1359,6 +1398,7 @@ class PreparedFramesRequest(PreparedBaseRequest):
     resize: float | None = None
     rotate: int | None = None
     monochrome: bool | None = None
+    n_workers: int | None = None
     images_expected: int = field(init=False)
 
     def prepare(self) -> "PreparedFramesRequest":
@@ -1375,6 +1415,7 @@ class PreparedFramesRequest(PreparedBaseRequest):
         self._prepare_dimensions()
         self._prepare_rotate()
         self._prepare_monochrome()
+        self._prepare_n_workers()
         self._prepare_images_expected()
         self._is_prepared = True
         return self
@@ -1429,6 +1470,12 @@ class PreparedFramesRequest(PreparedBaseRequest):
             self.monochrome = False
         return self.monochrome
 
+    def _prepare_n_workers(self) -> int:
+        """Set the number of workers to 1 if not specified."""
+        if self.n_workers is None:
+            self.n_workers = 1
+        return self.n_workers
+
     def _prepare_images_expected(self) -> int:
         """Set the number of images (frames) expected to be written to disk."""
         self.images_expected = P.prepare_images_expected(
@@ -1,6 +1,9 @@
 """Utility functions and classes used throughout the library."""
+import functools
 import json
+import os
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -8,10 +11,11 @@ from typing import Any, ClassVar, Protocol
 
 from rich import print
 
+import videoxt.validators as V
 from videoxt.constants import ExtractionMethod
-from videoxt.validators import positive_float, positive_int, valid_filename
 
 
+@functools.lru_cache(maxsize=256)
 def timestamp_to_seconds(timestamp: str) -> float:
     """
     Convert a timestamp string to the total number of seconds (float) it represents.
@@ -42,16 +46,19 @@ def timestamp_to_seconds(timestamp: str) -> float:
     Returns:
     -----
         `float`: The number of seconds converted from the timestamp string.
+
+    Raises:
+    -----
+        `ValueError`: If a part of the timestamp isn't an integer.
     """
-    timestamp = timestamp.split(".")[0]
-    time_parts = timestamp.split(":")
-    total_seconds: float = sum(
-        float(part) * 60**exponent for exponent, part in enumerate(reversed(time_parts))
-    )
+    total_seconds = 0
+    for part in timestamp.partition(".")[0].split(":"):
+        total_seconds = total_seconds * 60 + int(part)
 
-    return total_seconds
+    return float(total_seconds)
 
 
+@functools.lru_cache(maxsize=256)
 def seconds_to_timestamp(seconds: float) -> str:
     """
     Convert seconds to a time duration string in the format "HH:MM:SS" or "H:MM:SS".
@@ -170,7 +177,7 @@ def append_enumeration(index: int, tag: str | None = None) -> str:
         return f" ({index})"
 
     # Ensure the tag doesn't contain invalid characters for a file name.
-    tag = valid_filename(tag)
+    tag = V.valid_filename(tag)
 
     return f"{tag} ({index})" if index > 1 else tag
 
@@ -210,12 +217,12 @@ def enumerate_dir(directory: Path, tag: str | None = None) -> Path:
     if not directory.exists():
         return directory
 
+    is_taken = sibling_name_checker(directory)
     index = 1
     while True:
-        append_str = append_enumeration(index, tag=tag)
-        new_dir = directory.with_name(f"{directory.name}{append_str}")
-        if not new_dir.exists():
-            return new_dir
+        new_dirname = f"{directory.name}{append_enumeration(index, tag=tag)}"
+        if not is_taken(new_dirname):
+            return directory.with_name(new_dirname)
         index += 1
 
 
@@ -243,6 +250,7 @@ def enumerate_filepath(filepath: Path, tag: str | None = None) -> Path:
     Args:
     -----
         `filepath` (Path): The path to the file to potentially enumerate.
+        `tag` (str | None): The tag to enumerate. If None, only the index is used.
 
     Returns:
     -----
@@ -251,18 +259,69 @@ def enumerate_filepath(filepath: Path, tag: str | None = None) -> Path:
     if not filepath.exists():
         return filepath
 
+    is_taken = sibling_name_checker(filepath)
     index = 1
     while True:
         append_str = append_enumeration(index, tag)
         new_filename = f"{filepath.stem}{append_str}{filepath.suffix}"
-        new_filepath = filepath.with_name(new_filename)
 
-        if not new_filepath.exists():
-            return new_filepath
+        if not is_taken(new_filename):
+            return filepath.with_name(new_filename)
 
         index += 1
 
 
+def sibling_name_checker(path: Path, max_stats: int = 8) -> Callable[[str], bool]:
+    """
+    Return a function telling whether a name is taken in the directory containing
+    `path`.
+
+    The first `max_stats` names are checked with `Path.exists`. Past that, the directory
+    is listed once with `os.scandir` and the remaining names are checked against the
+    listing, so enumerating past many taken names costs no further system calls, while
+    a large directory isn't listed when a free name is found right away. A name in the
+    listing is taken. A name missing from it is confirmed free with `Path.exists`, so a
+    name that only differs in case from an existing file is still reported as taken on
+    a case-insensitive file system. If the directory can't be listed, every name is
+    checked with `Path.exists`.
+
+    Args:
+    -----
+        `path` (Path):
+            A path in the directory to check names in.
+        `max_stats` (int):
+            The number of names to check with `Path.exists` before listing the
+            directory.
+
+    Returns:
+    -----
+        `Callable[[str], bool]`: Returns True if the name is taken, False otherwise.
+    """
+    taken: set[str] | None = None
+    listing_failed = False
+    stats_left = max_stats
+
+    def is_taken(name: str) -> bool:
+        nonlocal taken, listing_failed, stats_left
+        if taken is None and not listing_failed and stats_left > 0:
+            stats_left -= 1
+            return path.with_name(name).exists()
+
+        if taken is None and not listing_failed:
+            try:
+                with os.scandir(path.parent) as entries:
+                    taken = {entry.name for entry in entries}
+            except OSError:
+                listing_failed = True  # XXX: log
+
+        if taken is None:
+            return path.with_name(name).exists()
+
+        return name in taken or path.with_name(name).exists()
+
+    return is_taken
+
+
 def calculate_duration(frame_count: int, fps: float) -> timedelta:
     """
     Return a timedelta representing the duration of a video using frame count and fps.
@@ -278,8 +337,8 @@ def calculate_duration(frame_count: int, fps: float) -> timedelta:
     -----
         `datetime.timedelta`: The duration of the video.
     """
-    frame_count = positive_int(frame_count)
-    fps = positive_float(fps)
+    frame_count = V.positive_int(frame_count)
+    fps = V.positive_float(fps)
     return timedelta(seconds=frame_count / fps)
 
 
@@ -313,7 +372,7 @@ def convert_bytes(n: int) -> str:
     -----
         `str`: A human readable string representing the number of bytes.
     """
-    n = positive_int(n)
+    n = V.positive_int(n)
     for size in ["bytes", "KB", "MB", "GB", "TB"]:
         if n < 1024.0:
             return f"{n:.2f} {size}"
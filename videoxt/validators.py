@@ -1,5 +1,6 @@
 """Contains functions to validate user input and other data."""
 import re
+import stat
 from pathlib import Path
 from typing import cast
 
@@ -7,6 +8,9 @@ import videoxt.constants as C
 import videoxt.utils as U
 from videoxt.exceptions import ValidationError
 
+# `M:SS`, `MM:SS`, `H:MM:SS` or `HH:MM:SS`, see `valid_timestamp`.
+_TIMESTAMP_PATTERN = re.compile(r"^([0-9]|[0-5][0-9])(:[0-5][0-9]){1,2}$")
+
 
 def positive_int(n: float | int | str) -> int:
     """
@@ -186,10 +190,13 @@ def valid_filepath(filepath: Path | str, is_video: bool = False) -> Path:
     except TypeError:
         raise ValidationError(f"Invalid filepath, got {filepath!r}")
 
-    if not fp.exists():
+    # A single stat() answers both "does it exist" and "is it a file".
+    try:
+        st_mode = fp.stat().st_mode
+    except OSError:
         raise ValidationError(f"File not found, got {filepath!r}")
 
-    if not fp.is_file():
+    if not stat.S_ISREG(st_mode):
         raise ValidationError(f"Filepath provided is not a file, got {filepath!r}")
 
     if is_video:
@@ -258,10 +265,9 @@ def valid_timestamp(timestamp: str) -> str:
     if timestamp is None or not timestamp:
         raise ValidationError(f"Timestamp string is empty or None, got {timestamp!r}")
 
-    timestamp = timestamp.split(".")[0]
+    timestamp = timestamp.partition(".")[0]
 
-    regex = r"^([0-9]|[0-5][0-9])(:[0-5][0-9]){1,2}$"
-    if not bool(re.match(regex, timestamp)):
+    if _TIMESTAMP_PATTERN.match(timestamp) is None:
         raise ValidationError(
             f"Invalid timestamp format, got {timestamp!r}\n"
             f"Allowed: 'M:SS', 'MM:SS', 'H:MM:SS', 'HH:MM:SS'"
@@ -496,13 +502,13 @@ def valid_rotate_value(n: float | int | str) -> int:
     except ValueError:
         raise ValidationError(
             f"Invalid rotate value, got {n!r}\n"
-            f"Allowed values: {C.VALID_ROTATE_VALUES}"
+            f"Allowed values: {sorted(C.VALID_ROTATE_VALUES)}"
         )
 
     if val not in C.VALID_ROTATE_VALUES:
         raise ValidationError(
             f"Invalid rotate value, got {n}\n"
-            f"Allowed values: {C.VALID_ROTATE_VALUES}"
+            f"Allowed values: {sorted(C.VALID_ROTATE_VALUES)}"
         )
 
     return val
@@ -533,7 +539,7 @@ def valid_audio_format(audio_format: str) -> str:
     if fmt not in C.SUPPORTED_AUDIO_FORMATS:
         raise ValidationError(
             f"Unsupported audio format, got {audio_format!r}\n"
-            f"Supported formats: {C.SUPPORTED_AUDIO_FORMATS}"
+            f"Supported formats: {sorted(C.SUPPORTED_AUDIO_FORMATS)}"
         )
 
     return fmt
@@ -564,12 +570,43 @@ def valid_image_format(image_format: str) -> str:
     if fmt not in C.SUPPORTED_IMAGE_FORMATS:
         raise ValidationError(
             f"Invalid image format, got {image_format!r}\n"
-            f"Supported image formats: {C.SUPPORTED_IMAGE_FORMATS}"
+            f"Supported image formats: {sorted(C.SUPPORTED_IMAGE_FORMATS)}"
         )
 
     return fmt
 
 
+def valid_hwaccel(hwaccel: str) -> str:
+    """
+    Validate hardware acceleration method is supported by `videoxt` and return it.
+
+    Input is converted to lowercase. `CUDA` and `cuda` would both be considered valid
+    and returned as `cuda`.
+
+    See supported methods here: `videoxt.constants.SUPPORTED_HWACCELS`.
+
+    Args:
+    -----
+        `hwaccel` (str): The hardware acceleration method to validate.
+
+    Returns:
+    -----
+        `str`: The hardware acceleration method if supported.
+
+    Raises:
+    -----
+        `ValidationError`: If the hardware acceleration method is not supported.
+    """
+    method = str(hwaccel).lower()
+    if method not in C.SUPPORTED_HWACCELS:
+        raise ValidationError(
+            f"Unsupported hardware acceleration method, got {hwaccel!r}\n"
+            f"Supported methods: {sorted(C.SUPPORTED_HWACCELS)}"
+        )
+
+    return method
+
+
 def valid_volume(volume: float | int | str) -> float:
     """
     Validate and return non-negative float audio volume. If input is negative, set to 0.
@@ -623,7 +660,7 @@ def valid_video_file_suffix(suffix: str) -> str:
     if sfx not in C.SUPPORTED_VIDEO_FORMATS:
         raise ValidationError(
             f"Invalid video file suffix, got {suffix!r}\n"
-            f"Supported: {C.SUPPORTED_VIDEO_FORMATS}"
+            f"Supported: {sorted(C.SUPPORTED_VIDEO_FORMATS)}"
         )
 
     return sfx
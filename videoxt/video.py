@@ -1,13 +1,15 @@
 """Contains Video class and functions for validating and retrieving video properties."""
+import functools
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import cv2  # type: ignore
 from moviepy.editor import VideoFileClip  # type: ignore
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos  # type: ignore
 
 import videoxt.utils as U
 import videoxt.validators as V
@@ -17,8 +19,16 @@ from videoxt.exceptions import (
     VideoValidationError,
 )
 
+# Properties read by `_read_video_properties`, in the order they're unpacked.
+_CAPTURE_PROPERTIES = (
+    cv2.CAP_PROP_FRAME_WIDTH,
+    cv2.CAP_PROP_FRAME_HEIGHT,
+    cv2.CAP_PROP_FPS,
+    cv2.CAP_PROP_FRAME_COUNT,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class Video:
     """
     Validate, set and store video properties such as the file path, dimensions, fps,
@@ -50,6 +60,11 @@ class Video:
             Size of the video file in bytes.
         `filesize` (str):
             Size of the video file in a human-readable format.
+
+    Notes:
+    -----
+        - The file path is validated once, on init. `open_video_capture` and the
+        extractors trust `Video.filepath` and don't validate it again.
     """
 
     filepath: Path
@@ -87,10 +102,9 @@ class Video:
 
     def setattrs_from_opencap(self) -> tuple[tuple[int, int], float, int]:
         """Set the dimensions, fps and frame count read from an opened video capture."""
-        properties = fetch_video_properties(self.filepath)
-        self.dimensions = properties.get("dimensions", None)
-        self.fps = properties.get("fps", None)
-        self.frame_count = properties.get("frame_count", None)
+        self.dimensions, self.fps, self.frame_count = get_video_properties(
+            self.filepath
+        )
 
         return self.dimensions, self.fps, self.frame_count
 
@@ -160,12 +174,23 @@ class Video:
         return self.filesize
 
     def setattr_has_audio(self) -> bool:
-        """Set the has_audio attribute with moviepy.editor import VideoFileClip.audio"""
-        with VideoFileClip(str(self.filepath)) as clip:
-            self.has_audio = bool(clip.audio)
+        """
+        Set the has_audio attribute from the streams ffmpeg lists for the video file,
+        without opening readers for them like `moviepy.editor.VideoFileClip` would.
+        """
+        infos = ffmpeg_parse_infos(str(self.filepath), check_duration=False)
+        self.has_audio = bool(infos["audio_found"])
         return self.has_audio
 
 
+class VideoProperties(NamedTuple):
+    """Unvalidated properties read from a video file by `get_video_properties`."""
+
+    dimensions: tuple[int, int]
+    fps: float
+    frame_count: int
+
+
 def fetch_video_properties(filepath: Path) -> dict[str, Any]:
     """
     Open the video file to retrieve and return the video's dimensions, fps, and frame
@@ -184,17 +209,64 @@ def fetch_video_properties(filepath: Path) -> dict[str, Any]:
             - "fps" (float): Frame rate of the video.
             - "frame_count" (int): Number of frames in the video.
     """
+    return get_video_properties(filepath)._asdict()
+
+
+def get_video_properties(filepath: Path) -> VideoProperties:
+    """
+    Open the video file to retrieve and return the video's dimensions, fps, and frame
+    count.
+
+    Args:
+    -----
+        `filepath` (Path): Path to the video file.
+
+    Returns:
+    -----
+        `VideoProperties`: The unvalidated video properties.
+
+    Notes:
+    -----
+        - The properties are cached per resolved file path, modification time and
+        size, so fetching them again for an unchanged file doesn't reopen the video,
+        and a relative path used from another working directory isn't mistaken for
+        the file it named before.
+    """
+    try:
+        resolved_filepath = Path(filepath).resolve()
+        stat_result = resolved_filepath.stat()
+    except (OSError, RuntimeError):
+        return _read_video_properties(filepath)
+
+    return _cached_video_properties(
+        str(resolved_filepath), stat_result.st_mtime_ns, stat_result.st_size
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_video_properties(
+    filepath: str, mtime_ns: int, size: int
+) -> VideoProperties:
+    """
+    Cache `_read_video_properties` per video file. `mtime_ns` and `size` only key the
+    cache, so a modified file is read again. Clear it with `cache_clear()`.
+    """
+    return _read_video_properties(filepath)
+
+
+def _read_video_properties(filepath: Path | str) -> VideoProperties:
+    """
+    Read the unvalidated properties returned by `get_video_properties`. `cv2` returns
+    every property as a float, so the dimensions and frame count are truncated to ints.
+    """
     with open_video_capture(filepath) as opencap:
-        frame_height: int = opencap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-        frame_width: int = opencap.get(cv2.CAP_PROP_FRAME_WIDTH)
-        fps: float = opencap.get(cv2.CAP_PROP_FPS)
-        frame_count: int = opencap.get(cv2.CAP_PROP_FRAME_COUNT)
+        frame_width, frame_height, fps, frame_count = map(
+            opencap.get, _CAPTURE_PROPERTIES
+        )
 
-    return {
-        "dimensions": (frame_width, frame_height),
-        "fps": fps,
-        "frame_count": frame_count,
-    }
+    return VideoProperties(
+        (int(frame_width), int(frame_height)), float(fps), int(frame_count)
+    )
 
 
 @contextmanager
@@ -202,6 +274,9 @@ def open_video_capture(filepath: Path) -> Iterator[cv2.VideoCapture]:
     """
     Context manager for opening a video file with `cv2.VideoCapture`.
 
+    The file path isn't validated beforehand, an invalid path only surfaces as a
+    `ClosedVideoCaptureError`. Validate it first, e.g. by constructing a `Video`.
+
     Usage:
     -----
     ```python
@@ -250,3 +325,39 @@ def open_video_capture(filepath: Path) -> Iterator[cv2.VideoCapture]:
             video_capture.release()
         except UnboundLocalError:
             pass  # Ctrl+C keyboard interrupt
+
+
+def open_video_clip(
+    filepath: Path, dimensions: tuple[int, int] | None = None
+) -> VideoFileClip:
+    """
+    Open a video file with `moviepy.editor.VideoFileClip`, having ffmpeg scale the
+    decoded frames to `dimensions` before they are piped into Python.
+
+    moviepy's reader always passes a `scale` filter to ffmpeg, so resizing there costs
+    nothing extra, and fewer bytes cross the pipe when downscaling. Resizing every frame
+    afterwards with `VideoFileClip.resize()` is then unnecessary.
+
+    Usage:
+    -----
+    ```python
+    >>> from videoxt.video import open_video_clip
+    >>> with open_video_clip('path/to/video.mp4', (640, 360)) as clip:
+    ...     clip.size
+    (640, 360)
+    ```
+
+    Args:
+    -----
+        `filepath` (Path):
+            Path to the video file.
+        `dimensions` (tuple[int, int] | None):
+            The (width, height) to scale the frames to. If None, the frames keep the
+            video's dimensions.
+
+    Returns:
+    -----
+        `moviepy.editor.VideoFileClip`: The opened clip, usable as a context manager.
+    """
+    target_resolution = None if dimensions is None else dimensions[::-1]
+    return VideoFileClip(str(filepath), target_resolution=target_resolution)